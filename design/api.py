@@ -329,7 +329,7 @@ shielded = asyncio.shield()による呼び出し
 ----------[DOC 3.1.1] broken frameのポーリングによるエラーチェック(疑似コード)-------------
 
 with root.start() OR ctx.start_subframes() as session:
-    while session.running():
+    for _ in session.tick(1):
         if broken_frame := session.get_broken_frame():
             if incomp_session := broken_frame.get_incomplete_session():
                 ...
@@ -342,7 +342,6 @@ with root.start() OR ctx.start_subframes() as session:
 
             if broken_frame.ignorable():
                 broken_frame.mark_as_ignored()
-        time.sleep(1)
 
 ---------------[DOC 3.1.2] broken frameの一括エラーチェック(疑似コード)--------------------
 
@@ -373,7 +372,7 @@ from __future__ import annotations
 from enum import Enum
 import logging
 
-from typing import Protocol, Any, Awaitable, Callable, TypeVar, Union, ContextManager, cast
+from typing import Protocol, Any, Awaitable, Callable, Iterator, TypeVar, Union, ContextManager, cast
 
 _T = TypeVar("_T")
 
@@ -408,6 +407,7 @@ FrameName = str
 FrameQualname = str
 
 class _HasFrameIdentity(Protocol):
+    __slots__ = ()
     @property
     def frame_name(self) -> FrameName:
         """このフレームの名前"""
@@ -421,6 +421,7 @@ SessionName = str
 SessionQualname = str
 
 class _HasSessionIdentity(Protocol):
+    __slots__ = ()
     @property
     def session_name(self) -> SessionName:
         """このセッションの名前"""
@@ -432,6 +433,7 @@ class _HasSessionIdentity(Protocol):
         ...
 
 class _HasLogger(Protocol):
+    __slots__ = ()
     @property
     def default_logger(self) -> logging.Logger:
         """このセッションが内部的に使用するデフォルトロガー  
@@ -448,11 +450,13 @@ class _HasLogger(Protocol):
         ...
 
 class _HasLogging(Protocol):
+    __slots__ = ()
     @property
     def logger(self) -> logging.Logger:
         ...
 
 class _HasFrameCoordinating(Protocol):
+    __slots__ = ()
 
     def running(self) -> bool:
         """フレームが実行中かどうかを判定する"""
@@ -465,6 +469,32 @@ class _HasFrameCoordinating(Protocol):
         """
         ...
     
+    async def wait_done_async(self, timeout: float | None = None) -> None:
+        """フレームの終了を非同期に待ち合わせる  
+
+        .wait_done()のコルーチン版。待機中にイベントループをブロックしない。  
+        timeoutにfloat(sec)が渡され、その時間内にフレームが完了しなかった場合TimeoutError
+        """
+        ...
+    
+    def tick(self, interval: float, timeout: float | None = None) -> Iterator[None]:
+        """フレームの状態変化またはinterval(sec)の経過ごとに1回yieldするイテレータを返す  
+        
+        `while session.running(): ...; time.sleep(interval)`の置き換えとして使う。  
+        フレームが終了した場合はsleepの残り時間を待たずに直ちにyieldし、その後イテレーションを終了する。  
+        timeoutにfloat(sec)が渡され、その時間内にフレームが完了しなかった場合はTimeoutErrorを送出する。
+        """
+        ...
+    
+    def poll(self) -> tuple[list[str], dict[str, BaseException]]:
+        """終了したフレーム名と未報告の例外を一度に取得する  
+        
+        ポーリングループで終了したフレームの回収と例外の確認を毎回行う場合に使う。  
+        戻り値は(終了したフレーム名のリスト, フレーム名をキーとする例外の辞書)。  
+        一度返したフレーム名と例外はこのメソッドから2度と返らない。
+        """
+        ...
+    
     def get_finished_frame(self) -> FrameResult:
         """終了したフレームの結果を取得する  
         
@@ -486,6 +516,24 @@ class _HasFrameCoordinating(Protocol):
         """
         ...
     
+    def wait_broken_frame(self, timeout: float | None = None) -> str | None:
+        """フレームが異常終了するまで待機し、そのフレーム名を返す  
+        
+        `while session.running(): ...; time.sleep(interval)`で異常終了を監視する代わりに使う。  
+        待機中はCPUを消費せず、フレームの異常終了と同時に復帰する。  
+        全てのフレームが未報告の異常終了なしに終了した場合はNoneを返す。  
+        一度返したフレーム名を2度と返さない。  
+        timeoutにfloat(sec)が渡され、その時間内に該当するフレームがなければTimeoutError
+        """
+        ...
+    
+    async def wait_broken_frame_async(self, timeout: float | None = None) -> str | None:
+        """フレームが異常終了するまで非同期に待機し、そのフレーム名を返す  
+        
+        .wait_broken_frame()のコルーチン版。待機中にイベントループをブロックしない。
+        """
+        ...
+    
     def get_all_finished_frames(self) -> list[FrameResult]:
         """現時点で終了しているフレームの結果をすべて取得する  
         
@@ -510,7 +558,39 @@ class _HasFrameCoordinating(Protocol):
         """
         ...
     
+    def get_finished_snapshot(self) -> tuple[list[FrameResult], list[FrameResult], list[FrameResult]]:
+        """現時点で終了しているフレームの結果を分類して一度に取得する  
+        
+        戻り値は(終了, 正常終了, 異常終了)の各フレームの結果のリスト。  
+        .get_all_finished_frames()、.get_all_successful_frames()、.get_all_broken_frames()を  
+        続けて呼び出す場合と異なり、3つのリストは同一時点の状態から作られる。
+        """
+        ...
+    
+    def iter_all_finished_frames(self) -> Iterator[FrameResult]:
+        """現時点で終了しているフレームの結果を走査するイテレータを返す  
+        
+        .get_all_finished_frames()のイテレータ版。呼び出し時点の結果を走査し、リストを作らない。  
+        結果を一度走査するだけの場合に使う。
+        """
+        ...
+    
+    def iter_all_successful_frames(self) -> Iterator[FrameResult]:
+        """現時点で正常終了しているフレームの結果を走査するイテレータを返す  
+        
+        .get_all_successful_frames()のイテレータ版。
+        """
+        ...
+    
+    def iter_all_broken_frames(self) -> Iterator[FrameResult]:
+        """現時点で異常終了しているフレームの結果を走査するイテレータを返す  
+        
+        .get_all_broken_frames()のイテレータ版。
+        """
+        ...
+    
 class _HasHandlerSetting(Protocol):
+    __slots__ = ()
     def set_on_exception(self, handler: ExceptionHandler) -> None:
         ...
     def set_on_redo(self, handler: RedoHandler) -> None:
@@ -595,6 +675,7 @@ class Context(_HasFrameIdentity, _HasLogging, Protocol):
     RoutineおよびHandler内で利用されることを前提とする。  
     フレーム終了後にContextを保持・再利用することはできない。  
     """
+    __slots__ = ()
     @property
     def environment(self) -> MessageReader:
         """環境変数  
@@ -647,6 +728,17 @@ class Context(_HasFrameIdentity, _HasLogging, Protocol):
         """
         ...
     
+    def define_subframes(self, *specs: tuple[Routine, str]) -> tuple[SubFrameBuilder, ...]:
+        """複数のサブフレームを一括してフレームに追加する  
+
+        specsは(routine, frame_name)のタプルで、渡された順にSubFrameBuilderを返す。  
+        各要素は.define_subframe(routine, frame_name)と同じ規則で検証され、  
+        一つでも不正な要素があった場合はどのサブフレームも追加されない。  
+        多数のサブフレームを定義する場合、個別に.define_subframe()を呼び出すよりも  
+        状態の検証とロックの取得が一度で済む。
+        """
+        ...
+    
     def supports_handlers(self) -> bool:
         """フレームがハンドラに対応しているか判定する"""
         ...
@@ -669,30 +761,31 @@ class GpFrameBaseError(Exception):
 
     このクラスおよびその派生クラスは、通常フレームワーク内部で生成される。  
     """
-    pass
+    __slots__ = ()
 
 class FrameStateError(GpFrameBaseError):
     """Frameの生成やハンドリングに由来する例外のベースクラス"""
-    pass
+    __slots__ = ()
 
 class MissingNameError(FrameStateError):
     """有効なフレーム名が存在しない場合にスローされる"""
-    pass
+    __slots__ = ()
 
 class FrameStillRunningError(FrameStateError):
     """フレームの動作中に削除を試みた場合にスローされる"""
-    pass
+    __slots__ = ()
 
 class MessageError(GpFrameBaseError):
     """Message由来例外のベースクラス"""
+    __slots__ = ()
 
 class RedefineError(MessageError):
     """すでに存在するキーを再度設定しようとした場合にスローされる"""
-    pass
+    __slots__ = ()
 
 class MessageKeyError(MessageError, KeyError):
     """キーが存在しない場合にスローされる"""
-    pass
+    __slots__ = ()
 
 class MessageTypeError(MessageError, TypeError):
     """キーが要求する型と一致しない場合スローされる  
@@ -701,27 +794,27 @@ class MessageTypeError(MessageError, TypeError):
     値がキーが要求する型のインスタンスではない場合(共変でない)。  
     読み書きの際に指定する型がキーが要求する型と同一でない場合(不変でない)。
     """
-    pass
+    __slots__ = ()
 
 class MessageValueError(MessageError, ValueError):
     """メッセージの値に不整合があった場合にスローされる"""
-    pass
+    __slots__ = ()
 
 class ConsumedError(MessageError):
     """値が存在しない場合にスローされる"""
-    pass
+    __slots__ = ()
 
 class IPCError(MessageError):
     """IPCによる通信由来例外のベースクラス"""
-    pass
+    __slots__ = ()
 
 class IPCValueError(IPCError, ValueError):
     """値のピクル化が失敗した場合にスローされる"""
-    pass
+    __slots__ = ()
 
 class IPCConnectionError(IPCError):
     """IPCの通信自体が失敗した場合にスローされる"""
-    pass
+    __slots__ = ()
 
 # +====================================================================================+
 # |  >>> [API C] AUTO-COMPLETION PROTOCOLS (USER-VISIBLE, NOT DIRECTLY IMPORTED)       |
@@ -754,9 +847,10 @@ RedoHandler = Union[
 # [API C.2] Builder Protocols
 #---------------------------------------------------------------------------------------
 class FrameBuilder(Protocol):
-    pass
+    __slots__ = ()
 
 class RootFrameBuilder(FrameBuilder, _HasFrameIdentity, _HasLogger, Protocol):
+    __slots__ = ()
     def set_environments(self, environments: dict[str, Any]) -> None:
         """環境変数の初期値を設定する"""
         ...
@@ -776,11 +870,13 @@ class RootFrameBuilder(FrameBuilder, _HasFrameIdentity, _HasLogger, Protocol):
         ...
 
 class ConcurrentRootFrameBuilder(RootFrameBuilder, _HasHandlerSetting, Protocol):
+    __slots__ = ()
     def _for_concurrent(self) -> None:
         """プロトコル分類用ダミーメソッド"""
         ...
 
 class ParallelRootFrameBuilder(RootFrameBuilder, Protocol):
+    __slots__ = ()
     def _for_parallel(self) -> None:
         """プロトコル分類用ダミーメソッド"""
         ...
@@ -792,16 +888,19 @@ class SubFrameBuilder(FrameBuilder, _HasFrameIdentity, _HasLogger, Protocol):
     SubFrameはそれ自体を単独で起動することができない。  
     起動にはContext.start_subframes()を使用する。  
     """
+    __slots__ = ()
     def _for_subframe(self) -> None:
         """プロトコル分類用ダミーメソッド"""
         ...
 
 class ConcurrentSubFrameBuilder(SubFrameBuilder, _HasHandlerSetting, Protocol):
+    __slots__ = ()
     def _for_concurrent(self) -> None:
         """プロトコル分類用ダミーメソッド"""
         ...
 
 class ParallelSubFrameBuilder(SubFrameBuilder, Protocol):
+    __slots__ = ()
     def _for_parallel(self) -> None:
         """プロトコル分類用ダミーメソッド"""
         ...
@@ -810,7 +909,7 @@ class ParallelSubFrameBuilder(SubFrameBuilder, Protocol):
 # [API C.3] Message Protocols
 #---------------------------------------------------------------------------------------
 class Message(Protocol):
-    pass
+    __slots__ = ()
 
 KeyType = Union[str, Enum]
 
@@ -820,6 +919,7 @@ class MessageReader(Message, Protocol):
     メッセージはIPCで接続されている場合がある。  
     この時IPCの接続に問題があり、読み取りが失敗した場合IPCConnectionError
     """
+    __slots__ = ()
 
     def exists(self, key: KeyType) -> bool:
         """キーが存在するか判定する"""
@@ -832,6 +932,16 @@ class MessageReader(Message, Protocol):
         typがkeyが要求する型と同一でなければMessageTypeError  
         """
         ...
+    
+    def get_many(self, items: tuple[tuple[KeyType, type], ...]) -> tuple:
+        """複数のキーに対応する値を一度に取得する  
+
+        itemsは(key, typ)のタプルで、値を同じ順序のタプルで返す。  
+        各要素は.get(key, typ)と同じ規則で検証される。  
+        .get()を繰り返す場合と異なり、全ての値は同一時点の状態から取得される。  
+        IPCで接続されている場合、通信は一度で済む。
+        """
+        ...
 
     def string(
         self,
@@ -907,6 +1017,7 @@ class MessageUpdater(MessageReader, Protocol):
     値の更新時にピクル化に関してエラーが起こった場合IPCValueError  
     IPCの接続に問題があり、更新できなかった場合IPCConnectionError
     """
+    __slots__ = ()
 
 
     def set(self, key: KeyType, typ: type[_T], value: _T) -> None:
@@ -917,6 +1028,16 @@ class MessageUpdater(MessageReader, Protocol):
         valueがkeyの要求する型のインスタンスでない場合MessageTypeError  
         """
     
+    def set_many(self, items: tuple[tuple[KeyType, type, Any], ...]) -> None:
+        """複数の値を一度に無条件に更新する  
+
+        itemsは(key, typ, value)のタプル。  
+        各要素は.set(key, typ, value)と同じ規則で検証され、いずれかが失敗した場合は何も更新されない。  
+        ロックの取得は一度で済み、IPCで接続されている場合、通信も一度で済む。  
+        ロックは再入可能ではないため、batch()のブロック内で呼び出してはならない(デッドロックする)。
+        """
+        ...
+    
     def swap(self, key: KeyType, typ: type[_T], value: _T) -> _T:
         """値を入れ替え、更新前の値を返す  
 
@@ -995,6 +1116,7 @@ class MessageDefiner(MessageReader, Protocol):
     値の更新時にピクル化に関してエラーが起こった場合IPCValueError  
     IPCの接続に問題があり、更新できなかった場合IPCConnectionError
     """
+    __slots__ = ()
     def define(self, key: KeyType, typ: type[_T], value: _T) -> None:
         """キーを定義し型と値を設定する  
 
@@ -1012,6 +1134,7 @@ class MessageManager(MessageUpdater, MessageDefiner, Protocol):
     値の更新時にピクル化に関してエラーが起こった場合IPCValueError  
     IPCの接続に問題があり、更新できなかった場合IPCConnectionError
     """
+    __slots__ = ()
     ...
 
 class BatchOperator(Protocol):
@@ -1021,6 +1144,7 @@ class BatchOperator(Protocol):
     既存キーに対してのみ操作を行うことができる。  
     keyの新規作成を行うことはできない。  
     """
+    __slots__ = ()
     def exists_key(self, key: KeyType) -> bool:
         """キーが存在するか判定する"""
         ...
@@ -1067,6 +1191,7 @@ class Session(
     _HasLogging,
     Protocol
 ):
+    __slots__ = ()
     def set_session_name(self, name: str) -> None:
         """このセッションの名前を設定する"""
         ...
@@ -1081,6 +1206,7 @@ class Session(
         ...
     
 class RootSession(Session, Protocol):
+    __slots__ = ()
     def _for_root(self) -> None:
         """プロトコル分類用ダミーメソッド"""
         ...
@@ -1114,6 +1240,7 @@ class SubSession(Session, Protocol):
 
     Messageの読み書きはContextを使用する。  
     """
+    __slots__ = ()
     def _for_subframe(self) -> None:
         """プロトコル分類用ダミーメソッド"""
         ...
@@ -1123,12 +1250,14 @@ class SubSession(Session, Protocol):
 #---------------------------------------------------------------------------------------
 
 class FrameErrorRecord(_HasFrameIdentity):
+    __slots__ = ()
     def get(self) -> BaseException:
         """Frameが投げた例外を取得する"""
         ...
 
 class SessionResult(Protocol):
     """Sessionの制御結果"""
+    __slots__ = ()
     
     def completes(self) -> bool:
         """セッションが完全に終了しているか判定する  
@@ -1161,6 +1290,7 @@ class FrameResult(_HasFrameIdentity, Protocol):
     実行結果の成否とその原因の提供。または、結果を分類するためのマークインターフェースを提供  
     する。
     """
+    __slots__ = ()
     def successful(self) -> bool:
         """frameが成功しているかどうかを判定する  
 
@@ -1,21 +1,32 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
 
+async def _no_event(ctx) -> None:
+    return None
+
 class EventHandlerWrapper:
+    __slots__ = ('event_name', 'caller', 'is_async')
     def __init__(self, event_name: str):
         self.event_name = event_name
-        self.caller = None
+        self.caller = _no_event
+        self.is_async = False
+    
+    def __call__(self, ctx):
+        # See RedoHandlerWrapper.__call__()
+        return self.caller(ctx)
     
-    async def __call__(self, ctx):
-        if self.caller is not None:
-            return await self.caller(ctx)
+    def shielded(self, ctx):
+        # See ExceptionHandlerWrapper.shielded()
+        if self.is_async:
+            return asyncio.shield(self(ctx))
+        return self(ctx)
                 
     def set_handler(self, handler):
-        if inspect.iscoroutinefunction(handler):
-            async def async_caller(ctx):
-                return await handler(ctx)
-            self.caller = async_caller
+        self.is_async = inspect.iscoroutinefunction(handler)
+        if self.is_async:
+            self.caller = handler
         else:
             async def sync_caller(ctx):
                 return handler(ctx)
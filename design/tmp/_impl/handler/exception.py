@@ -1,23 +1,32 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
 
+async def _not_consumed(ctx, exc) -> bool:
+    return False
+
 class ExceptionHandlerWrapper:
-    __slots__ = ('caller',)
+    __slots__ = ('caller', 'is_async')
     def __init__(self):
-        self.caller = None
+        self.caller = _not_consumed
+        self.is_async = False
+    
+    def __call__(self, ctx, exc):
+        # See RedoHandlerWrapper.__call__()
+        return self.caller(ctx, exc)
     
-    async def __call__(self, ctx, exc) -> bool:
-        if self.caller is not None:
-            consumed = await self.caller(ctx, exc)
-            return consumed
-        return False
+    def shielded(self, ctx, exc):
+        # A sync (or missing) handler never suspends, so cancellation cannot
+        # reach it and asyncio.shield() would only allocate a future.
+        if self.is_async:
+            return asyncio.shield(self(ctx, exc))
+        return self(ctx, exc)
         
     def set_handler(self, handler):
-        if inspect.iscoroutinefunction(handler):
-            async def async_caller(ctx, exc):
-                return await handler(ctx, exc)
-            self.caller = async_caller
+        self.is_async = inspect.iscoroutinefunction(handler)
+        if self.is_async:
+            self.caller = handler
         else:
             async def sync_caller(ctx, exc) -> bool:
                 return handler(ctx, exc)
@@ -1,21 +1,22 @@
 
 import inspect
 
+async def _no_redo(ctx) -> bool:
+    return False
+
 class RedoHandlerWrapper:
     __slots__ = ('caller',)
     def __init__(self):
-        self.caller = None
+        self.caller = _no_redo
     
-    async def __call__(self, ctx) -> bool:
-        if self.caller is not None:
-            return await self.caller(ctx)
-        return False
+    def __call__(self, ctx):
+        # Returns the handler's coroutine directly; whether to wrap was
+        # decided once in set_handler().
+        return self.caller(ctx)
     
     def set_handler(self, handler):
         if inspect.iscoroutinefunction(handler):
-            async def async_handler(ctx):
-                return await handler(ctx)
-            self.caller = async_handler
+            self.caller = handler
         else:
             async def sync_caller(ctx) -> bool:
                 return handler(ctx)
@@ -22,6 +22,7 @@ def create_intra_process_context(
         request: MessageRegistry[Any],
         event_msg: MessageRegistry[Any],
         routine_msg: MessageRegistry[Any],
+        local_msg: MessageRegistry[Any],
         routine_result: RoutineResultSource,
         inter_frame_msg: MessageReflector,
         ipc_msg: MessageReflector,
@@ -46,7 +47,7 @@ def create_intra_process_context(
         
         @property
         def local(self) -> MessageUpdater[Any]:
-            ...
+            return local_msg.updater
         
         @property
         def common(self) -> MessageUpdater[str]:
@@ -105,6 +106,7 @@ def create_root_routine_context(
         request: MessageRegistry[Any],
         event_msg: MessageRegistry[Any],
         routine_msg: MessageRegistry[Any],
+        local_msg: MessageRegistry[Any],
         routine_result: RoutineResultSource,
         inter_frame_msg: MessageReflector,
         ipc_msg: MessageReflector,
@@ -132,6 +134,9 @@ def create_root_routine_context(
         def routine_message(self) -> MessageUpdater[Any]:
             return routine_msg.updater
         @property
+        def local(self) -> MessageUpdater[Any]:
+            return local_msg.updater
+        @property
         def routine_result(self) -> RoutineResult:
             return routine_result.interface
         @property
@@ -188,6 +193,7 @@ def create_sub_routine_context(
         request: MessageRegistry[Any],
         event_msg: MessageRegistry[Any],
         routine: MessageRegistry[Any],
+        local_msg: MessageRegistry[Any],
         routine_result: RoutineResultSource,
         inter_frame_msg: MessageReflector,
         ipc_msg: MessageReflector,
@@ -214,6 +220,9 @@ def create_sub_routine_context(
         def routine_message(self) -> MessageUpdater[Any]:
             return routine.updater
         @property
+        def local(self) -> MessageUpdater[Any]:
+            return local_msg.updater
+        @property
         def routine_result(self) -> RoutineResult:
             return routine_result.interface
         @property
@@ -268,6 +277,7 @@ def create_root_event_context(
         request: MessageRegistry[Any],
         event_msg: MessageRegistry[Any],
         routine: MessageRegistry[Any],
+        local_msg: MessageRegistry[Any],
         routine_result: RoutineResultSource,
         inter_frame_msg: MessageReflector,
         ipc_msg: MessageReflector,
@@ -295,6 +305,9 @@ def create_root_event_context(
         def routine_message(self) -> MessageReader[Any]:
             return routine.reader
         @property
+        def local(self) -> MessageUpdater[Any]:
+            return local_msg.updater
+        @property
         def routine_result(self) -> RoutineResult:
             return routine_result.interface
         @property
@@ -317,6 +330,7 @@ def create_sub_event_context(
         request: MessageRegistry[Any],
         event_msg: MessageRegistry[Any],
         routine: MessageRegistry[Any],
+        local_msg: MessageRegistry[Any],
         routine_result: RoutineResultSource,
         inter_frame_msg: MessageReflector,
         ipc_msg: MessageReflector,
@@ -343,6 +357,9 @@ def create_sub_event_context(
         def routine_message(self) -> MessageReader[Any]:
             return routine.reader
         @property
+        def local(self) -> MessageUpdater[Any]:
+            return local_msg.updater
+        @property
         def routine_result(self) -> RoutineResult:
             return routine_result.interface
         @property
@@ -2,10 +2,50 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+import threading
 
 from gpframe._impl.frame.frame_base import _FrameBaseState as FrameBaseState
+from gpframe._impl.frame.future import FrameExecutorImpl, FrameRunState
+from gpframe._impl.frame.worker import submit_frame_worker, acquire_frame_loop, release_frame_loop
 from gpframe._impl.routine.result import _NO_VALUE
 
+def run_circuit_in_thread(
+        executor: FrameExecutorImpl,
+        frame_base: FrameBaseState,
+        ectx,
+        rctx,
+        routine_execution,
+        routine,
+) -> None:
+    def worker():
+        loop = acquire_frame_loop()
+        circuit_task = loop.create_task(
+            circuit(frame_base, ectx, rctx, routine_execution, routine)
+        )
+        circuit_exc = None
+        run_state = FrameRunState(
+            thread = threading.current_thread(),
+            loop = loop,
+            circuit_task = circuit_task,
+        )
+        executor._start(run_state)
+        try:
+            loop.run_until_complete(circuit_task)
+        except BaseException as e:
+            circuit_exc = e
+        finally:
+            # The loop stays with this worker thread for its next frame;
+            # it is cleared before the frame is reported as terminated.
+            try:
+                release_frame_loop(loop)
+            finally:
+                frame_base.phase_role.interface.to_terminated()
+                executor._end(circuit_exc)
+
+    submit_frame_worker(worker)
+    executor.future_is_ready.wait()
+
+
 async def circuit(
         base: FrameBaseState,
         ectx,
@@ -16,18 +56,22 @@ async def circuit(
     event_handlers = base.event_handlers
     exception_handler = base.exception_handler
     redo_handler = base.redo_handler
+    # The execution kind is fixed when the frame is built, so whether its
+    # result has to be awaited is decided once, not on every redo.
+    wait_routine_result = routine_execution.get_wait_routine_result_fn()
+    awaits_result = inspect.iscoroutinefunction(wait_routine_result)
     try:
         try:
             await base.event_handlers["on_open"](ectx)
         except BaseException as e:
-            if not await asyncio.shield(exception_handler(ectx, e)):
+            if not await exception_handler.shielded(ectx, e):
                 raise
 
         while True:
             try:
                 await event_handlers["on_start"](ectx)
             except BaseException as e:
-                if not await asyncio.shield(exception_handler(ectx, e)):
+                if not await exception_handler.shielded(ectx, e):
                     raise
             
             try:
@@ -35,36 +79,35 @@ async def circuit(
                     routine,
                     rctx)
             except BaseException as e:
-                if not await asyncio.shield(exception_handler(ectx, e)):
+                if not await exception_handler.shielded(ectx, e):
                     raise
             
             
             result = _NO_VALUE
             rexc: Exception | None = None
             try:
-                wait_routine_result = routine_execution.get_wait_routine_result_fn()
-                tuple_or_coro = wait_routine_result(
-                    base.routine_timeout
-                )
-                if inspect.iscoroutine(tuple_or_coro):
-                    result, rexc = await tuple_or_coro
-                elif isinstance(tuple_or_coro, tuple):
-                    result, rexc = tuple_or_coro
+                if awaits_result:
+                    result, rexc = await wait_routine_result(base.routine_timeout)
                 else:
-                    raise RuntimeError
+                    outcome = wait_routine_result(base.routine_timeout)
+                    # A wait function that returns an awaitable without
+                    # being declared async def is a bug, not a result
+                    if not isinstance(outcome, tuple):
+                        raise RuntimeError(f"routine result wait returned {type(outcome).__name__}, not a tuple")
+                    result, rexc = outcome
             except BaseException as e:
-                if not await asyncio.shield(exception_handler(ectx, e)):
+                if not await exception_handler.shielded(ectx, e):
                     raise
             
 
             if isinstance(rexc, asyncio.CancelledError):
-                if not await asyncio.shield(exception_handler(ectx, rexc)):
+                if not await exception_handler.shielded(ectx, rexc):
                     raise
                 else:
                     rexc = None
             
             if rexc:
-                if not await asyncio.shield(exception_handler(ectx, rexc)):
+                if not await exception_handler.shielded(ectx, rexc):
                     raise
             
             base.routine_result.set(result, rexc)
@@ -72,13 +115,13 @@ async def circuit(
             try:
                 await event_handlers["on_end"](ectx)
             except BaseException as e:
-                if not await asyncio.shield(exception_handler(ectx, e)):
+                if not await exception_handler.shielded(ectx, e):
                     raise
             
             try:
                 redo = await redo_handler(ectx)
             except BaseException as e:
-                if not await asyncio.shield(exception_handler(ectx, e)):
+                if not await exception_handler.shielded(ectx, e):
                     raise
 
             if not redo:
@@ -86,15 +129,15 @@ async def circuit(
 
     except asyncio.CancelledError as e:
         try:
-            await asyncio.shield(event_handlers["on_cancel"](ectx))
+            await event_handlers["on_cancel"].shielded(ectx)
         except BaseException as e:
-            if not await asyncio.shield(exception_handler(ectx, e)):
+            if not await exception_handler.shielded(ectx, e):
                 raise
     finally:
         try:
-            await asyncio.shield(event_handlers["on_close"](ectx))
+            await event_handlers["on_close"].shielded(ectx)
         except BaseException as e:
-            if not await asyncio.shield(exception_handler(ectx, e)):
+            if not await exception_handler.shielded(ectx, e):
                 raise
 
         
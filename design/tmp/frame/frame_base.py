@@ -2,12 +2,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import sys
 import threading
 from typing import Callable
 
 from gpframe.contracts.api import _FrameBase
 
 from gpframe.exceptions import FrameTerminatedError
+from gpframe.contracts.exceptions import MissingNameError
 
 from gpframe._impl.phase import _Role as PhaseRole, create_phase_manager_role
 
@@ -15,6 +17,7 @@ from gpframe._impl.handler.event import EventHandlerWrapper
 from gpframe._impl.handler.redo import RedoHandlerWrapper
 from gpframe._impl.handler.exception import ExceptionHandlerWrapper
 
+from gpframe._impl.message.lock import ConfinedLock
 from gpframe._impl.message.message import MessageRegistry
 from gpframe._impl.routine.result import RoutineResultSource
 
@@ -26,6 +29,19 @@ ALL_EVENTS = (
     'on_close'
 )
 
+def resolve_frame_name(frame_name: str, routine: Callable, *registered: dict) -> str:
+    # Shared by root and sub-frame creation. An empty name falls back to
+    # routine.__name__. Names are interned so that later lookups in the
+    # sub-frame registry compare by identity.
+    name = frame_name or getattr(routine, "__name__", "")
+    if not name.isidentifier():
+        raise MissingNameError(f"no valid frame name for {routine!r}: '{name}'")
+    name = sys.intern(name)
+    for names in registered:
+        if name in names:
+            raise ValueError(f"frame name '{name}' already exists")
+    return name
+
 @dataclass(slots = True)
 class _FrameBaseState:
     frame_name: str
@@ -42,6 +58,7 @@ class _FrameBaseState:
 
     event_message: MessageRegistry
     routine_message: MessageRegistry
+    local_message: MessageRegistry
 
     routine_result: RoutineResultSource
 
@@ -63,10 +80,14 @@ class _FrameBaseUpdater:
         
         phase_role = create_phase_manager_role()
         
+        def raise_terminated():
+            raise FrameTerminatedError
+
+        if_terminated = phase_role.interface.if_terminated
+
+        # Called on every message access; stays lock-free until terminated.
         def phase_validator():
-            def fn():
-                raise FrameTerminatedError
-            phase_role.interface.if_terminated(fn)
+            if_terminated(raise_terminated)
 
         return _FrameBaseState(
             frame_name = frame_name,
@@ -81,6 +102,7 @@ class _FrameBaseUpdater:
             exception_handler = ExceptionHandlerWrapper(),
             event_message = MessageRegistry(intra_frame_lock, dict(), phase_validator),
             routine_message = MessageRegistry(intra_frame_lock, dict(), phase_validator),
+            local_message = MessageRegistry(ConfinedLock(), dict(), phase_validator),
             routine_result = RoutineResultSource(intra_frame_lock, phase_validator),
             routine_timeout = None,
             cleanup_timeout = None,
@@ -91,6 +113,7 @@ def create_frame_base_role(frame_name: str) -> _FrameBaseRole:
 
     updater = _FrameBaseUpdater()
 
+    # frame_name comes from resolve_frame_name(), which has interned it
     state = updater.create_state(frame_name)
 
     class _Interface(_FrameBase):
@@ -5,24 +5,28 @@ from dataclasses import dataclass
 import inspect
 import logging
 
-from typing import Callable, Iterator
-from contextlib import contextmanager
+from typing import Callable
 
 from gpframe.contracts.api import RootFrameFuture, SubFrameFuture, gproot, frame, routine
 
 from gpframe.exceptions import FrameAlreadyStartedError
 
+from gpframe._impl.common import _default_logger
+from gpframe._impl.message.codec import Codec, DEFAULT_CODEC
+
 from gpframe._impl.routine.base import IntraProcessRoutineExecution
 from gpframe._impl.routine.asynchronous import AsyncRoutine
 from gpframe._impl.routine.synchronous import SyncRoutine
 
 from gpframe._impl.frame.frame_base import (
     _FrameBaseState,
+    resolve_frame_name
 )
 
 from gpframe._impl.frame.root_base import (
     _RootFrameBaseRole,
     _RootFrameBaseState,
+    _StartContext,
     create_root_frame_base_role
 )
 
@@ -31,7 +35,8 @@ from gpframe._impl.frame.sub_ipc import _IPCSubFrameRole, create_ipc_sub_frame_r
 
 from gpframe._impl.context import create_root_event_context, create_root_routine_context
 
-from gpframe._impl.frame.future import FrameFutureImpl, RootFrameExecutorImpl, SubFrameExecutorImpl, run_circuit_in_thread, wrap_to_interface
+from gpframe._impl.frame.future import FrameFutureImpl, RootFrameExecutorImpl, SubFrameExecutorImpl, wrap_to_interface
+from gpframe._impl.frame.circuit import run_circuit_in_thread
 
 @dataclass(slots = True)
 class _RootFrameState:
@@ -51,6 +56,7 @@ class _RootFrameRole:
 
 
 class _RootFrameUpdater:
+    __slots__ = ()
     def create_state(
             self,
             logger: logging.Logger,
@@ -67,7 +73,12 @@ class _RootFrameUpdater:
             def fn() -> SubFrameFuture:
                 #スタート済みだから、root_frame_executorは存在する。
                 assert root_frame_executor is not None
-                sub_frame_role = sub_frames[frame_name][1]
+                # Ownership is decided by membership in this frame's own
+                # registry; no runtime type inspection of the sub-frame.
+                entry = sub_frames.get(frame_name)
+                if entry is None:
+                    raise ValueError(f"'{frame_name}' is not a sub-frame of this frame")
+                sub_frame_role = entry[1]
                 sub_frame_executor = sub_frame_role.start_fn()
                 #サブフレームがスタートしているかどうか？
                 return sub_frame_executor.interface
@@ -80,6 +91,7 @@ class _RootFrameUpdater:
             root_frame_base_state.request_message,
             frame_base_state.event_message,
             frame_base_state.routine_message,
+            frame_base_state.local_message,
             frame_base_state.routine_result,
             root_frame_base_state.inter_frame_message,
             root_frame_base_state.ipc_message,
@@ -93,6 +105,7 @@ class _RootFrameUpdater:
             root_frame_base_state.request_message,
             frame_base_state.event_message,
             frame_base_state.routine_message,
+            frame_base_state.local_message,
             frame_base_state.routine_result,
             root_frame_base_state.inter_frame_message,
             root_frame_base_state.ipc_message,
@@ -113,8 +126,8 @@ class _RootFrameUpdater:
             started_frame_futures
         )
 
-def create_root_frame_role(frame_name: str, routine: routine.Root, *, logger: logging.Logger):
-    root_frame_base_role = create_root_frame_base_role(frame_name, logger)
+def create_root_frame_role(frame_name: str, routine: routine.Root, *, logger: logging.Logger, codec: Codec = DEFAULT_CODEC):
+    root_frame_base_role = create_root_frame_base_role(frame_name, logger, codec)
     
     frame_base_state = root_frame_base_role.frame_base_role.state
     root_base_state = root_frame_base_role.state
@@ -126,11 +139,13 @@ def create_root_frame_role(frame_name: str, routine: routine.Root, *, logger: lo
     root_frame_executor: RootFrameExecutorImpl | None = None
 
     class _Interface(frame.RootFrame, root_frame_base_role.interface_type):
+        __slots__ = ()
 
         def create_sub_frame(self, frame_name: str, routine: routine.Sub) -> frame.SubFrame:
             def fn():
+                name = resolve_frame_name(frame_name, routine, state.sub_frames)
                 sub_frame_role = create_sub_frame_role(
-                    frame_name,
+                    name,
                     logger,
                     routine,
                     root_base_state.environment_message,
@@ -139,14 +154,37 @@ def create_root_frame_role(frame_name: str, routine: routine.Root, *, logger: lo
                     root_base_state.ipc_message
                     )
                 sub_frame = sub_frame_role.interface_type()
-                state.sub_frames[frame_name] = (sub_frame, sub_frame_role)
+                state.sub_frames[name] = (sub_frame, sub_frame_role)
                 return sub_frame
             return frame_base_state.phase_role.interface.on_load(fn)
 
+        def define_subframes(self, *specs: tuple[routine.Sub, str]) -> tuple[frame.SubFrame, ...]:
+            # (routine, frame_name) pairs, as in the spec's define_subframes.
+            # All sub-frames are built under a single phase check and
+            # registered together; nothing is registered if one fails.
+            def fn():
+                created = {}
+                for sub_routine, frame_name in specs:
+                    name = resolve_frame_name(frame_name, sub_routine, created, state.sub_frames)
+                    sub_frame_role = create_sub_frame_role(
+                        name,
+                        logger,
+                        sub_routine,
+                        root_base_state.environment_message,
+                        root_base_state.request_message,
+                        root_base_state.inter_frame_message,
+                        root_base_state.ipc_message
+                        )
+                    created[name] = (sub_frame_role.interface_type(), sub_frame_role)
+                state.sub_frames.update(created)
+                return tuple(sub_frame for sub_frame, _ in created.values())
+            return frame_base_state.phase_role.interface.on_load(fn)
+
         def create_ipc_sub_frame(self, frame_name: str, routine: routine.ipc.Sub) -> frame.SubFrame:
             def fn():
+                name = resolve_frame_name(frame_name, routine, state.sub_frames)
                 ipc_sub_frame_role = create_ipc_sub_frame_role(
-                    frame_base_state.frame_name,
+                    name,
                     logger,
                     routine,
                     root_base_state.ml_sync_manager,
@@ -156,21 +194,21 @@ def create_root_frame_role(frame_name: str, routine: routine.Root, *, logger: lo
                     root_base_state.ipc_message,
                     )
                 sub_frame = ipc_sub_frame_role.interface_type()
-                state.sub_frames[frame_name] = (sub_frame, ipc_sub_frame_role)
+                state.sub_frames[name] = (sub_frame, ipc_sub_frame_role)
                 return sub_frame
             return frame_base_state.phase_role.interface.on_load(fn)
         
         def stop_routine(self) -> None:
             state.routine_execution.request_stop_routine()
         
-        @contextmanager
-        def start(self) -> Iterator[RootFrameFuture]:
+        def start(self) -> _StartContext[RootFrameFuture]:
             def fn() -> RootFrameFuture:
                 nonlocal root_frame_executor
                 root_frame_executor = RootFrameExecutorImpl(
                     frame_name = frame_base_state.frame_name
                 )
-                root_frame_executor.run_circuit_in_thread(
+                run_circuit_in_thread(
+                    root_frame_executor,
                     frame_base_state,
                     state.event_context,
                     state.routine_context,
@@ -178,10 +216,10 @@ def create_root_frame_role(frame_name: str, routine: routine.Root, *, logger: lo
                     routine,
                 )
                 return root_frame_executor.interface
-            try:
-                yield frame_base_state.phase_role.interface.to_started(fn)
-            finally:
-                root_frame_base_role.cleanup_fn()
+            return _StartContext(
+                lambda: frame_base_state.phase_role.interface.to_started(fn),
+                root_frame_base_role.cleanup_fn
+            )
         
     return _RootFrameRole(
         root_frame_base_role = root_frame_base_role,
@@ -191,8 +229,8 @@ def create_root_frame_role(frame_name: str, routine: routine.Root, *, logger: lo
     )
 
 
-def create_frame(frame_name: str, routine: routine.Root, *, logger: logging.Logger | None = None) -> frame.RootFrame:
-    logger = logger if logger else logging.getLogger("gpframe")
-    role = create_root_frame_role(frame_name, routine, logger = logger)
+def create_frame(frame_name: str, routine: routine.Root, *, logger: logging.Logger | None = None, codec: Codec | None = None) -> frame.RootFrame:
+    logger = logger if logger else _default_logger()
+    role = create_root_frame_role(resolve_frame_name(frame_name, routine), routine, logger = logger, codec = codec if codec else DEFAULT_CODEC)
     return role.interface_type()
 
@@ -2,17 +2,19 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import Callable, cast
+from typing import Callable, Generic, TypeVar, cast
 
 
 import logging
 import threading
-import multiprocessing
 from multiprocessing.managers import SyncManager
 
 from gpframe.contracts.api import handler, _RootFrameBase
 
-from gpframe._impl.message.message import MessageRegistry
+from gpframe._impl.message.lock import StripedLock
+from gpframe._impl.message.message import FrozenMessageRegistry, MessageRegistry
+from gpframe._impl.message.shared import MessageSyncManager, SharedMessageMap, SharedMessageRegistry
+from gpframe._impl.message.codec import Codec, DEFAULT_CODEC
 from gpframe._impl.message.reflector import MessageReflector
 
 
@@ -25,6 +27,7 @@ from gpframe._impl.frame.frame_base import (
 @dataclass(slots = True)
 class _RootFrameBaseState:
     ml_sync_manager: SyncManager
+    shared_message_map: SharedMessageMap
     inter_frame_lock: threading.Lock
     ipc_lock: threading.Lock
 
@@ -34,6 +37,7 @@ class _RootFrameBaseState:
     request_message: MessageRegistry
     inter_frame_message: MessageReflector
     ipc_message: MessageReflector
+    ipc_registry: SharedMessageRegistry
 
 @dataclass(slots = True)
 class _RootFrameBaseRole:
@@ -45,15 +49,20 @@ class _RootFrameBaseRole:
 
 
 class _RootFrameBaseUpdater:
-    def create_state(self, frame_base_state: _FrameBaseState, logger: logging.Logger) -> _RootFrameBaseState:
+    __slots__ = ()
+    def create_state(self, frame_base_state: _FrameBaseState, logger: logging.Logger, codec: Codec) -> _RootFrameBaseState:
         inter_frame_lock = threading.Lock()
-        ml_sync_manager = multiprocessing.Manager()
-        ipc_lock = ml_sync_manager.Lock()
+        ml_sync_manager = MessageSyncManager()
+        ml_sync_manager.start()
+        shared_message_map = ml_sync_manager.SharedMessageMap() # type: ignore
+        ipc_lock = shared_message_map.get_lock()
         
         environments = {}
 
-        environment_message = MessageRegistry(
-            inter_frame_lock,
+        # Environments are written only while loading (under the phase lock)
+        # and shared by reference with every sub-frame, so frames read them
+        # without locking.
+        environment_message = FrozenMessageRegistry(
             environments,
             frame_base_state.phase_validtor
         )
@@ -72,39 +81,64 @@ class _RootFrameBaseUpdater:
         inter_frame_message = MessageReflector(
             namespace,
             MessageRegistry(
-                inter_frame_lock,
+                StripedLock(),
                 {},
-                frame_base_state.phase_validtor
+                frame_base_state.phase_validtor,
+                combine_writes = True
             )
         )
-        ipc_message = MessageReflector(
-            namespace,
-            MessageRegistry(
-                ipc_lock,
-                ml_sync_manager.dict(),
-                frame_base_state.phase_validtor
-            )
+        ipc_registry = SharedMessageRegistry(
+            shared_message_map,
+            frame_base_state.phase_validtor,
+            codec = codec
         )
+        ipc_message = MessageReflector(namespace, ipc_registry)
 
         return _RootFrameBaseState(
             ml_sync_manager = ml_sync_manager,
+            shared_message_map = shared_message_map,
             inter_frame_lock = inter_frame_lock,
             ipc_lock = ipc_lock,
             environments = environments,
             environment_message = environment_message,
             request_message = request_message,
             inter_frame_message = inter_frame_message,
-            ipc_message = ipc_message
+            ipc_message = ipc_message,
+            ipc_registry = ipc_registry
         )
 
-def create_root_frame_base_role(frame_name: str, logger: logging.Logger):
+_F = TypeVar("_F")
+
+class _StartContext(Generic[_F]):
+    """Context manager returned by RootFrame.start()
+
+    Plain class instead of @contextmanager: no generator is created and
+    resumed per start, and exit does not go through StopIteration.
+    """
+    __slots__ = ("_start_fn", "_cleanup_fn")
+    def __init__(self, start_fn: Callable[[], _F], cleanup_fn: Callable[[], None]):
+        self._start_fn = start_fn
+        self._cleanup_fn = cleanup_fn
+    
+    def __enter__(self) -> _F:
+        try:
+            return self._start_fn()
+        except BaseException:
+            self._cleanup_fn()
+            raise
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._cleanup_fn()
+
+
+def create_root_frame_base_role(frame_name: str, logger: logging.Logger, codec: Codec = DEFAULT_CODEC):
     frame_base_role = create_frame_base_role(frame_name)
     
     frame_base_state = frame_base_role.state
 
     updater = _RootFrameBaseUpdater()
 
-    state = updater.create_state(frame_base_state, logger)
+    state = updater.create_state(frame_base_state, logger, codec)
 
     class _Interface(_RootFrameBase, frame_base_role.interface_type):
         __slots__ = ()
@@ -149,10 +183,18 @@ def create_root_frame_base_role(frame_name: str, logger: logging.Logger):
             frame_base_state.phase_role.interface.on_load(fn)
     
     def cleanup() -> None:
+        state.ipc_registry.close()
+        try:
+            # Shared memory blocks outlive the manager unless released. The
+            # manager also frees them when it exits (see SharedMessageMap),
+            # but not if it is killed.
+            state.shared_message_map.clear()
+        except Exception:
+            logger.exception("failed to release the ipc messages of frame '%s'", frame_name)
         try:
             state.ml_sync_manager.shutdown()
-        except Exception as e:
-            pass # TODO: logging about exception
+        except Exception:
+            logger.exception("failed to shut down the message manager of frame '%s'", frame_name)
     
     return _RootFrameBaseRole(
         frame_base_role = frame_base_role,
@@ -1,29 +1,33 @@
 from __future__ import annotations
 
-from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Callable, Iterator
+from typing import Callable
 
 import logging
 
 from multiprocessing.managers import SyncManager
 
-from contextlib import contextmanager
 
 from gpframe.contracts.api import RootFrameFuture, gproot, frame, routine
 
-from gpframe._impl.frame.future import RootFrameExecutorImpl, run_circuit_in_thread, wrap_to_interface
+from gpframe._impl.common import _default_logger
+from gpframe._impl.message.codec import Codec, DEFAULT_CODEC
+
+from gpframe._impl.frame.future import RootFrameExecutorImpl, wrap_to_interface
+from gpframe._impl.frame.circuit import run_circuit_in_thread
 
 from gpframe._impl.routine.subprocess import IPCRoutineExecution
 from gpframe._impl.routine.subprocess import SyncRoutineInSubprocess
 
 from gpframe._impl.frame.frame_base import (
     _FrameBaseState,
+    resolve_frame_name
 )
 
 from gpframe._impl.frame.root_base import (
     _RootFrameBaseRole,
     _RootFrameBaseState,
+    _StartContext,
     create_root_frame_base_role
 )
 
@@ -47,6 +51,7 @@ class _RootFrameRole:
 
 
 class _RootFrameUpdater:
+    __slots__ = ()
     def create_state(
             self,
             logger: logging.Logger,
@@ -68,6 +73,7 @@ class _RootFrameUpdater:
             root_frame_base_state.request_message,
             frame_base_state.event_message,
             frame_base_state.routine_message,
+            frame_base_state.local_message,
             frame_base_state.routine_result,
             root_frame_base_state.inter_frame_message,
             root_frame_base_state.ipc_message,
@@ -93,8 +99,8 @@ class _RootFrameUpdater:
             routine_execution,
         )
 
-def create_ipc_root_frame_role(frame_name: str, routine: routine.ipc.Root, *, logger: logging.Logger):
-    root_frame_base_role = create_root_frame_base_role(frame_name, logger)
+def create_ipc_root_frame_role(frame_name: str, routine: routine.ipc.Root, *, logger: logging.Logger, codec: Codec = DEFAULT_CODEC):
+    root_frame_base_role = create_root_frame_base_role(frame_name, logger, codec)
     
     frame_base_state = root_frame_base_role.frame_base_role.state
     root_base_state = root_frame_base_role.state
@@ -110,16 +116,17 @@ def create_ipc_root_frame_role(frame_name: str, routine: routine.ipc.Root, *, lo
     )
 
     class _Interface(frame.IPCRootFrame, root_frame_base_role.interface_type):
+        __slots__ = ()
         def stop_routine(self, kill: bool = False) -> None:
             state.routine_execution.request_stop_routine(kill)
         
-        @contextmanager
-        def start(self) -> Iterator[RootFrameFuture]:
+        def start(self) -> _StartContext[RootFrameFuture]:
             def fn() -> RootFrameFuture:
                 frame_executor = RootFrameExecutorImpl(
                     frame_name = frame_base_state.frame_name
                 )
-                frame_executor.run_circuit_in_thread(
+                run_circuit_in_thread(
+                    frame_executor,
                     frame_base_state,
                     state.event_context,
                     state.routine_context,
@@ -127,10 +134,10 @@ def create_ipc_root_frame_role(frame_name: str, routine: routine.ipc.Root, *, lo
                     routine,
                 )
                 return frame_executor.interface
-            try:
-                yield frame_base_state.phase_role.interface.to_started(fn)
-            finally:
-                root_frame_base_role.cleanup_fn()
+            return _StartContext(
+                lambda: frame_base_state.phase_role.interface.to_started(fn),
+                root_frame_base_role.cleanup_fn
+            )
     
     return _RootFrameRole(
         root_frame_base_role = root_frame_base_role,
@@ -140,7 +147,7 @@ def create_ipc_root_frame_role(frame_name: str, routine: routine.ipc.Root, *, lo
     )
 
 
-def create_ipc_frame(frame_name: str, routine: routine.ipc.Root, *, logger: logging.Logger | None = None) -> frame.IPCRootFrame:
-    logger = logger if logger else logging.getLogger("gpframe")
-    role = create_ipc_root_frame_role(frame_name, routine, logger = logger)
+def create_ipc_frame(frame_name: str, routine: routine.ipc.Root, *, logger: logging.Logger | None = None, codec: Codec | None = None) -> frame.IPCRootFrame:
+    logger = logger if logger else _default_logger()
+    role = create_ipc_root_frame_role(resolve_frame_name(frame_name, routine), routine, logger = logger, codec = codec if codec else DEFAULT_CODEC)
     return role.interface_type()
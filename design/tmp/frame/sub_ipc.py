@@ -11,6 +11,7 @@ from multiprocessing.managers import SyncManager
 from gpframe.contracts.api import gpsub, frame, handler, routine
 
 from gpframe._impl.frame.future import RootFrameExecutorImpl, SubFrameExecutorImpl
+from gpframe._impl.frame.circuit import run_circuit_in_thread
 
 from gpframe._impl.message.message import MessageRegistry
 from gpframe._impl.message.reflector import MessageReflector
@@ -55,6 +56,7 @@ class _SubFrameUpdater:
             request_message,
             frame_base_state.event_message,
             frame_base_state.routine_message,
+            frame_base_state.local_message,
             frame_base_state.routine_result,
             inter_frame_message,
             ipc_message            
@@ -115,7 +117,8 @@ def create_ipc_sub_frame_role(
                 frame_name = frame_base_state.frame_name,
                 root = root_executor,
             )
-            frame_executor.run_circuit_in_thread(
+            run_circuit_in_thread(
+                frame_executor,
                 frame_base_state,
                 state.event_context,
                 state.routine_context,
@@ -52,7 +52,20 @@ class Phase(IntEnum):
         return self.get_next() is to
 
 class InvalidPhaseError(Exception):
-    pass
+    # Raised whenever an operation is used in the wrong phase, e.g. by every
+    # message access after the frame has ended, so the phases are stored and
+    # the message is only built when the error is printed. BaseException.__new__
+    # keeps the arguments in self.args, so pickling still works.
+    __slots__ = ("current", "required", "transition")
+    def __init__(self, current: Phase, required: Phase, transition: bool = False):
+        self.current = current
+        self.required = required
+        self.transition = transition
+    
+    def __str__(self):
+        if self.transition:
+            return f"Invalid transition: {self.current.name} → {self.required.name}"
+        return f"Invalid phase: {self.current.name} (requires {self.required.name})"
 
 @dataclass(slots = True)
 class _State:
@@ -70,9 +83,15 @@ class _Core:
             if keep is state.current_phase:
                 return fn()
             else:
-                raise InvalidPhaseError
+                raise InvalidPhaseError(state.current_phase, keep)
     
     def if_on(self, state: _State, on: Phase, fn: Callable[[], Any]):
+        # Lock-free fast path for the common "not in that phase" case.
+        # current_phase is only rebound under state.lock and a reference
+        # read is atomic, so a stale read is just ordered before a
+        # concurrent transition. A hit is re-checked under the lock.
+        if on is not state.current_phase:
+            return
         with state.lock:
             if on is state.current_phase:
                 return fn()
@@ -80,7 +99,7 @@ class _Core:
     def transit_state_unsafe(self, state: _State, to: Phase) -> None:
         current_phase = state.current_phase
         if not current_phase.transitionable(to):
-            raise InvalidPhaseError(f"Invalid transition: {current_phase} → {to}")
+            raise InvalidPhaseError(current_phase, to, True)
         state.current_phase = to
 
     def transit_state_with(self, state: _State, to: Phase, fn: Callable[[], R]) -> R:
@@ -112,6 +131,7 @@ def create_phase_manager_role():
     state = core.initialzie()
 
     class _Interface(PhaseManager):
+        __slots__ = ()
         def on_load(self, fn: Callable[[], R] = _NOOP) -> R:
             return core.maintain(state, Phase.LOAD, fn)
 
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from enum import Enum
 import threading
 from typing import Any, Callable
 
@@ -8,8 +7,7 @@ from gpframe.contracts.api import routine, _T, _D, _NO_DEFAULT
 
 from gpframe.exceptions import RoutineResultTypeError, RoutineResultMissingError
 
-class _NO_VALUE(Enum):
-    _ = "dummy"
+from gpframe._impl.common import _NO_VALUE
 
 class RoutineResultSource():
     __slots__ = ("_phase_validator", "_lock", "_routine_result", "_routine_error", "_interface")
@@ -31,7 +29,7 @@ class RoutineResultSource():
                     routine_result = outer._routine_result
                 if routine_result is _NO_VALUE:
                     raise RoutineResultMissingError
-                if not isinstance(routine_result, typ):
+                if type(routine_result) is not typ and not isinstance(routine_result, typ):
                     raise RoutineResultTypeError
                 return routine_result
 
@@ -41,7 +39,7 @@ class RoutineResultSource():
                 with outer._lock:
                     routine_result = outer._routine_result
                 if routine_result is not _NO_VALUE:
-                    if not isinstance(routine_result, typ):
+                    if type(routine_result) is not typ and not isinstance(routine_result, typ):
                         raise RoutineResultTypeError
                     return routine_result
                 elif default is not _NO_DEFAULT:
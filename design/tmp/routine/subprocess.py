@@ -2,13 +2,17 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+import logging
+import pickle
 import sys
 
 from logging import Logger
 from threading import Lock
+from traceback import format_exception
 from typing import Any
+from weakref import WeakKeyDictionary
 
-from multiprocessing import Queue, Process
+from multiprocessing import Queue, Process, get_start_method
 from queue import Empty
 
 from logging.handlers import QueueListener
@@ -23,54 +27,159 @@ from gpframe._impl.routine.base import (
     AsyncRoutineResultWaitFn
 )
 
+from gpframe._impl.message.codec import encode, decode
 from gpframe._impl.protocols import _QueueLike
 
 class SubprocessError(Exception):
+    __slots__ = ("exitcode",)
     def __init__(self, exitcode: int | None):
-        super().__init__(f"Subprocess execution failed (exit code {exitcode})")
         self.exitcode = exitcode
     
+    def __str__(self):
+        return f"Subprocess execution failed (exit code {self.exitcode})"
+    
+
+class _RemoteTraceback(Exception):
+    """Traceback text of an exception raised in the routine subprocess"""
+    __slots__ = ("tb",)
+    def __init__(self, tb: str):
+        # args keeps tb so that the cause survives being pickled again
+        super().__init__(tb)
+        self.tb = tb
+    def __str__(self):
+        return self.tb
+
+def _rebuild_exception(exc: BaseException, tb: str) -> BaseException:
+    exc.__cause__ = _RemoteTraceback(tb)
+    return exc
+
+class _ExceptionWithTraceback:
+    # Tracebacks cannot be pickled; the formatted text travels instead and
+    # is attached as __cause__ on the parent side (as concurrent.futures does).
+    __slots__ = ("exc", "tb")
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+        self.tb = "".join(format_exception(exc))
+    def __reduce__(self):
+        return (_rebuild_exception, (self.exc, self.tb))
 
-def _subprocess_entry(routine, context: gproot.ipc.routine.Context | gpsub.ipc.routine.Context, result_queue: Queue, log_queue: Queue):
+def _encode_result(result: Any, exc: BaseException | None) -> Any:
+    # Pickled once here with protocol 5 (see codec.encode); the queue then
+    # only forwards bytes. A result or exception that cannot be pickled is
+    # reported as an error instead of killing the subprocess in put().
+    try:
+        return encode((result, None if exc is None else _ExceptionWithTraceback(exc)))
+    except Exception as e:
+        what = "result" if exc is None else f"exception {exc!r}"
+        failure = RuntimeError(f"routine {what} could not be pickled: {e!r}")
+        return encode((_NO_VALUE, _ExceptionWithTraceback(failure)))
+
+def _subprocess_entry(routine, context: gproot.ipc.routine.Context | gpsub.ipc.routine.Context, result_queue: Queue, log_queue: Queue, log_level: int):
     import logging, logging.handlers
 
     logger = logging.getLogger(context.logger_name)
+    # Mirror the parent's effective level so that disabled records are
+    # dropped by isEnabledFor() here, before a LogRecord is built,
+    # formatted and pickled onto the log queue.
+    logger.setLevel(log_level)
     logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     try:
         if inspect.iscoroutinefunction(routine):
-            result = asyncio.run(routine(context)), None
+            result = _encode_result(asyncio.run(routine(context)), None)
         else:
-            result = routine(context), None
+            result = _encode_result(routine(context), None)
     except Exception as e:
-        result = _NO_VALUE, e
+        result = _encode_result(_NO_VALUE, e)
 
     result_queue.put(result)
 
     sys.exit(0)
 
+def _packed_subprocess_entry(packed: bytes, result_queue: Queue, log_queue: Queue, log_level: int):
+    routine_blob, context = pickle.loads(packed)
+    _subprocess_entry(pickle.loads(routine_blob), context, result_queue, log_queue, log_level)
+
+# routine -> pickled routine, shared by every frame that runs the same
+# routine, so a routine used by many sub-frames is serialized once.
+# Only module-level functions are cached: they pickle by reference, so the
+# blob stays valid. Callable instances and closures pickled by value would
+# be frozen at their first pickle.
+_routine_blobs: WeakKeyDictionary[Any, bytes] = WeakKeyDictionary()
+
+def _dump_routine(routine) -> bytes:
+    if not _pickles_by_reference(routine):
+        return _dumps_routine(routine)
+    blob = _routine_blobs.get(routine)
+    if blob is None:
+        blob = _dumps_routine(routine)
+        _routine_blobs[routine] = blob
+    return blob
+
+def _pickles_by_reference(routine) -> bool:
+    if not inspect.isfunction(routine) or routine.__closure__:
+        return False
+    # pickle looks the function up by module and qualified name
+    obj = sys.modules.get(routine.__module__)
+    for name in routine.__qualname__.split("."):
+        obj = getattr(obj, name, None)
+    return obj is routine
+
+def _dumps_routine(routine) -> bytes:
+    try:
+        return pickle.dumps(routine, protocol = pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError) as e:
+        # Lambdas and closures cannot be pickled by reference; cloudpickle
+        # (optional) pickles them by value. The child only needs it
+        # installed, not imported in advance.
+        try:
+            import cloudpickle
+        except ImportError:
+            raise e
+        return cloudpickle.dumps(routine, protocol = pickle.HIGHEST_PROTOCOL)
+
 class SyncRoutineInSubprocess(IPCRoutineExecution):
-    __slots__ = ("_lock", "_result_queue", "_log_queue", "_listener", "_process", "_called_stop")
+    __slots__ = ("_lock", "_result_queue", "_log_queue", "_log_level", "_listener", "_process", "_called_stop", "_packed")
     def __init__(self, lock: Lock, r_queue: _QueueLike, l_queue: _QueueLike):
         self._lock = lock
         self._result_queue = r_queue
         self._log_queue = l_queue
+        self._log_level = logging.NOTSET
         self._process = None
         self._called_stop = False
+        self._packed = None
     
     def set_logger_unsafe(self, logger: Logger):
-        self._listener = QueueListener(self._log_queue, *logger.handlers)
+        self._log_level = logger.getEffectiveLevel()
+        self._listener = QueueListener(self._log_queue, *logger.handlers, respect_handler_level = True)
         self._listener.start()
     
     def load_routine(self, routine, context) -> None:
+        if get_start_method() == "fork":
+            # Nothing is pickled: the child inherits routine and context.
+            target = _subprocess_entry
+            payload = (routine, context)
+        else:
+            # spawn/forkserver pickle the process arguments on every start.
+            # Pickle routine and context once and reuse the bytes for every
+            # redo of the same routine.
+            target = _packed_subprocess_entry
+            payload = (self._pack(routine, context),)
         with self._lock:
             self._called_stop = False
             self._process = Process(
-                target = _subprocess_entry,
-                args = (routine, context, self._result_queue, self._log_queue)
+                target = target,
+                args = (*payload, self._result_queue, self._log_queue, self._log_level)
             )
         self._process.start()
     
+    def _pack(self, routine, context) -> bytes:
+        packed = self._packed
+        if packed is None or packed[0] is not routine or packed[1] is not context:
+            packed = (routine, context, pickle.dumps((_dump_routine(routine), context), protocol = pickle.HIGHEST_PROTOCOL))
+            self._packed = packed
+        return packed[2]
+    
     def wait_routine_result(self, timeout: float | None = None) -> tuple[Any | _NO_VALUE, Exception | None]:
         if self._process is None:
             raise RuntimeError("routine is not loading")
@@ -79,7 +188,7 @@ class SyncRoutineInSubprocess(IPCRoutineExecution):
             if not self._process.is_alive():
                 exitcode = self._process.exitcode
                 if exitcode == 0:
-                    return self._result_queue.get_nowait()
+                    return decode(self._result_queue.get_nowait())
                 else:
                     raise SubprocessError(exitcode)
             else:
@@ -0,0 +1,46 @@
+import asyncio
+from enum import Enum
+from functools import cache
+import logging
+from typing import Callable, Hashable, TypeVar
+
+
+_T = TypeVar("_T")
+_D = TypeVar("_D")
+_K = TypeVar("_K", contravariant = True, bound = Hashable)
+
+class _NO_DEFAULT(Enum):
+    _ = "dummy member"
+
+class _NO_VALUE(Enum):
+    _ = "dummy"
+
+def _any_str(v: str) -> bool:
+    return True
+def _any_int(v: int) -> bool:
+    return True
+def _any_float(v: float) -> bool:
+    return True
+def _noop(v: str) -> str:
+    return v
+
+@cache
+def _event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop]:
+    # uvloop is optional (and unavailable on Windows).
+    # Resolved once: a failed import searches sys.path again on every try.
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop
+    return uvloop.new_event_loop
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    # The loop is created explicitly instead of installing a global policy
+    # so that the host application's event loop is left untouched.
+    return _event_loop_factory()()
+
+@cache
+def _default_logger() -> logging.Logger:
+    # Resolved once per process instead of going through the logging
+    # module's global lock on every frame creation.
+    return logging.getLogger("gpframe")
@@ -0,0 +1,500 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Iterator
+
+from gpframe.contracts.exceptions import FrameAggregateError
+
+if TYPE_CHECKING:
+    from gpframe.contracts.api import RootFrameFuture, SubFrameFuture
+
+class FrameError(Exception):
+    # Raised by raise_if() while polling; the message is only built when
+    # the error is printed. BaseException.__new__ keeps the arguments in
+    # self.args, so pickling still works without super().__init__().
+    __slots__ = ("frame_name", "cause")
+    def __init__(self, frame_name: str, cause: BaseException):
+        self.frame_name = frame_name
+        self.cause = cause
+    
+    def __str__(self):
+        message = f"frame [{self.frame_name}]"
+        if self.cause:
+            message += f": {type(self.cause).__name__}: {self.cause}"
+        return message
+
+class RootFrameError(FrameError):
+    __slots__ = ()
+
+class SubFrameError(FrameError):
+    __slots__ = ()
+
+
+def _set_done(fut: asyncio.Future) -> None:
+    if not fut.done():
+        fut.set_result(None)
+
+def _set_timeout(fut: asyncio.Future) -> None:
+    if not fut.done():
+        fut.set_exception(TimeoutError())
+
+
+class _LoopWaiters:
+    """Futures of coroutines waiting for a condition, one per waiter.
+
+    Guarded by the owner's lock. The owner calls notify_unsafe() right after
+    changing the state the condition reads, so waiters are woken without
+    polling and without a helper thread or task per wait.
+    """
+    __slots__ = ("_waiters",)
+    def __init__(self):
+        self._waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+    
+    def notify_unsafe(self) -> None:
+        waiters = self._waiters
+        self._waiters = []
+        for loop, fut in waiters:
+            loop.call_soon_threadsafe(_set_done, fut)
+    
+    async def wait(self, lock: threading.Lock, ready: Callable[[], object], timeout: float | None) -> None:
+        # ready is checked under lock. Returning only means the owner has
+        # notified; callers whose condition can become false again re-check.
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        waiter = (loop, fut)
+        with lock:
+            if ready():
+                return
+            self._waiters.append(waiter)
+        # call_later instead of asyncio.wait_for: no extra task per wait
+        handle = loop.call_later(timeout, _set_timeout, fut) if timeout is not None else None
+        try:
+            await fut
+        finally:
+            if handle is not None:
+                handle.cancel()
+            with lock:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+
+
+@dataclass(slots = True, frozen = True, kw_only = True)
+class FrameRunState:
+    thread: threading.Thread
+    loop: asyncio.AbstractEventLoop
+    circuit_task: asyncio.Task
+
+@dataclass(slots = True, kw_only = True)
+class FrameExecutorImpl(ABC):
+    frame_name: str
+
+    lock: threading.Lock = field(default_factory = threading.Lock, init = False)
+    run_state: FrameRunState | None = field(default = None, init = False)
+    circuit_error: BaseException | None = field(default = None, init = False)
+    future_is_ready: threading.Event = field(default_factory = threading.Event, init = False)
+    circuit_is_ended: threading.Event = field(default_factory = threading.Event, init = False)
+    loop_waiters: _LoopWaiters = field(default_factory = _LoopWaiters, init = False)
+    
+    def cancel(self):
+        with self.lock:
+            if self.run_state is not None:
+                run_state = self.run_state
+                if self.future_is_ready.is_set():
+                    if not run_state.circuit_task.done() and run_state.thread.is_alive():
+                        run_state.loop.call_soon_threadsafe(run_state.circuit_task.cancel)
+
+    @abstractmethod
+    def wait_done(self, *, timeout: float | None = None, raises: bool = False) -> None:
+        ...
+    
+    @abstractmethod
+    def processing(self) -> bool:
+        ...
+    
+    @abstractmethod
+    def _start(self, run_state: FrameRunState):
+        # Thread-unsafe: caller must ensure synchronization
+        if self.future_is_ready.is_set():
+            raise RuntimeError
+        self.run_state = run_state
+        self.future_is_ready.set()
+
+    @abstractmethod
+    def _end(self, circuit_exc: BaseException | None):
+        # Thread-unsafe: caller must ensure synchronization
+        if self.circuit_is_ended.is_set():
+            raise RuntimeError
+        self.circuit_error = circuit_exc
+        self.circuit_is_ended.set()
+
+
+
+@dataclass(slots = True)
+class RootFrameExecutorImpl(FrameExecutorImpl):
+    started_sub_frame_count: int = field(default = 0, init = False)
+    failed_frames: dict = field(default_factory = dict, init = False)
+    # Names of failed frames not reported yet, in failure order. A failure
+    # reported by raise_if(), poll() or wait_broken_frame() is removed from
+    # failed_frames, so wait_done() only raises what was never reported.
+    unraised_frames: deque = field(default_factory = deque, init = False)
+    # Names of sub-frames that ended since the last gather(), in end order.
+    # Appended under the lock, popped lock-free (see raise_if).
+    ended_frames: deque = field(default_factory = deque, init = False)
+    # Every sub-frame that has ended -> its exception (None on success), in
+    # end order. Unlike the queues above it is never consumed; snapshot()
+    # partitions it.
+    finished_frames: dict = field(default_factory = dict, init = False)
+    # Set once the root circuit and every started sub-frame have ended.
+    # Waiters block on it instead of polling processing().
+    frames_are_ended: threading.Event = field(default_factory = threading.Event, init = False)
+    # Notified (under self.lock) whenever the root circuit or a sub-frame ends
+    state_changed: threading.Condition = field(init = False)
+    # Coroutine counterpart of state_changed
+    state_waiters: _LoopWaiters = field(default_factory = _LoopWaiters, init = False)
+    interface: RootFrameFuture = field(init = False)
+
+    def __post_init__(self):
+        self.state_changed = threading.Condition(self.lock)
+        self.interface = self._create_interface()
+    
+    def wait_done(self, *, timeout: float | None = None) -> None:
+        if not self.frames_are_ended.wait(timeout):
+            raise TimeoutError
+        self._raise_if_failed()
+
+    async def wait_done_async(self, *, timeout: float | None = None) -> None:
+        await self.loop_waiters.wait(self.lock, self.frames_are_ended.is_set, timeout)
+        self._raise_if_failed()
+
+    def _raise_if_failed(self) -> None:
+        with self.lock:
+            if self.circuit_error is not None or self.failed_frames:
+                raise FrameAggregateError(self.frame_name, self.circuit_error, dict(self.failed_frames))
+
+    def processing(self) -> bool:
+        return not self.frames_are_ended.is_set()
+
+    def tick(self, interval: float, timeout: float | None = None) -> Iterator[None]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.frames_are_ended.is_set():
+            with self.state_changed:
+                if not self.frames_are_ended.is_set():
+                    self.state_changed.wait(_tick_wait(interval, deadline))
+            yield
+
+    def raise_if(self) -> None:
+        # Each failure is raised at most once and is consumed by raising it.
+        # unraised_frames and ended_frames are never rebound, and
+        # deque.append()/popleft() are atomic, so consumers pop without the
+        # lock; the lock is only taken to consume a failure that was found.
+        unraised_frames = self.unraised_frames
+        popleft = unraised_frames.popleft
+        # Polling loops mostly find nothing; a truth test is far cheaper
+        # than the IndexError that ends the popleft() loop.
+        while unraised_frames:
+            try:
+                sub_frame = popleft()
+            except IndexError:
+                return
+            with self.lock:
+                exc = self.failed_frames.pop(sub_frame, None)
+            if exc is not None:
+                raise SubFrameError(sub_frame, exc)
+
+    def gather(self) -> list[str]:
+        ended_frames = self.ended_frames
+        ended: list[str] = []
+        popleft = ended_frames.popleft
+        # See raise_if()
+        while ended_frames:
+            try:
+                ended.append(popleft())
+            except IndexError:
+                break
+        return ended
+
+    def poll(self) -> tuple[list[str], dict[str, BaseException]]:
+        # gather() plus the failures raise_if() would report, for polling
+        # loops: failures are collected under a single lock acquisition and
+        # are consumed as raise_if() consumes them.
+        ended = self.gather()
+        failed: dict[str, BaseException] = {}
+        if self.unraised_frames:
+            popleft = self.unraised_frames.popleft
+            with self.lock:
+                while self.unraised_frames:
+                    try:
+                        sub_frame = popleft()
+                    except IndexError:
+                        break
+                    exc = self.failed_frames.pop(sub_frame, None)
+                    if exc is not None:
+                        failed[sub_frame] = exc
+        return ended, failed
+
+    def gather_one(self, timeout: float | None = None) -> str:
+        # Edge-triggered: wakes on the notification sent when a sub-frame ends
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.state_changed:
+            while True:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if not self.state_changed.wait_for(lambda: self.ended_frames, remaining):
+                    raise TimeoutError
+                try:
+                    return self.ended_frames.popleft()
+                except IndexError:
+                    # Emptied by gather(), which pops without the lock,
+                    # between the wake-up and this popleft(); wait again.
+                    pass
+
+    def wait_broken_frame(self, timeout: float | None = None) -> str | None:
+        # Sleeps on state_changed until a sub-frame fails instead of polling
+        # raise_if(). The failure is consumed as raise_if() consumes it
+        # (it stays visible through snapshot()). None once every frame has
+        # ended without an unreported failure.
+        with self.state_changed:
+            if not self.state_changed.wait_for(self._has_broken_frame_or_ended_unsafe, timeout):
+                raise TimeoutError
+            return self._pop_broken_frame_unsafe()
+
+    async def wait_broken_frame_async(self, timeout: float | None = None) -> str | None:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining < 0.0:
+                    remaining = 0.0
+            await self.state_waiters.wait(self.lock, self._has_broken_frame_or_ended_unsafe, remaining)
+            with self.lock:
+                sub_frame = self._pop_broken_frame_unsafe()
+                # Woken by a sub-frame that ended without failing: wait again
+                if sub_frame is not None or self.frames_are_ended.is_set():
+                    return sub_frame
+
+    def _has_broken_frame_or_ended_unsafe(self) -> bool:
+        return bool(self.unraised_frames) or self.frames_are_ended.is_set()
+
+    def _pop_broken_frame_unsafe(self) -> str | None:
+        while self.unraised_frames:
+            sub_frame = self.unraised_frames.popleft()
+            if self.failed_frames.pop(sub_frame, None) is not None:
+                return sub_frame
+        return None
+
+    def snapshot(self) -> tuple[list[str], list[str], dict[str, BaseException]]:
+        # (finished, successful, broken) under one lock acquisition and in
+        # one pass, instead of one call, lock and scan per category.
+        finished: list[str] = []
+        successful: list[str] = []
+        broken: dict[str, BaseException] = {}
+        with self.lock:
+            for sub_frame, exc in self.finished_frames.items():
+                finished.append(sub_frame)
+                if exc is None:
+                    successful.append(sub_frame)
+                else:
+                    broken[sub_frame] = exc
+        return finished, successful, broken
+
+    # Iterators over a tuple taken under the lock when called (not when first
+    # advanced), for callers that scan once: no list is built.
+    def iter_finished_frames(self) -> Iterator[str]:
+        with self.lock:
+            finished = tuple(self.finished_frames)
+        return iter(finished)
+
+    def iter_successful_frames(self) -> Iterator[str]:
+        with self.lock:
+            successful = tuple(sub_frame for sub_frame, exc in self.finished_frames.items() if exc is None)
+        return iter(successful)
+
+    def iter_broken_frames(self) -> Iterator[tuple[str, BaseException]]:
+        with self.lock:
+            broken = tuple(item for item in self.finished_frames.items() if item[1] is not None)
+        return iter(broken)
+
+    def drain(self) -> dict[str, BaseException]:
+        with self.lock:
+            drained = self.failed_frames
+            self.failed_frames = {}
+            self.unraised_frames.clear()
+        return drained
+
+    
+    def _start(self, run_state: FrameRunState):
+        with self.lock:
+            FrameExecutorImpl._start(self, run_state)
+
+    def _end(self, circuit_exc: BaseException | None):
+        with self.lock:
+            FrameExecutorImpl._end(self, circuit_exc)
+            self._notify_if_frames_are_ended_unsafe()
+
+    def _notify_if_frames_are_ended_unsafe(self):
+        if self.circuit_is_ended.is_set() and self.started_sub_frame_count == 0:
+            self.frames_are_ended.set()
+            self.loop_waiters.notify_unsafe()
+        self.state_changed.notify_all()
+        self.state_waiters.notify_unsafe()
+
+    def _on_start_sub_frame(self):
+        with self.lock:
+            if self.circuit_is_ended.is_set():
+                raise RuntimeError
+            self.started_sub_frame_count += 1
+    
+    def _on_end_sub_frame(self, frame_name: str, exc: BaseException | None):
+        with self.lock:
+            self.started_sub_frame_count -= 1
+            if self.started_sub_frame_count < 0:
+                raise RuntimeError
+            if exc is not None:
+                self.failed_frames[frame_name] = exc
+                self.unraised_frames.append(frame_name)
+            self.ended_frames.append(frame_name)
+            self.finished_frames[frame_name] = exc
+            self._notify_if_frames_are_ended_unsafe()
+            
+    def _create_interface(self) -> RootFrameFuture:
+        outer = self
+        class RootFrameFuture:
+            __slots__ = ()
+            @property
+            def frame_name(self) -> str:
+                return outer.frame_name
+            
+            def cancel(self):
+                outer.cancel()
+
+            def wait_done(self, *, timeout: float | None = None, raises: bool = False) -> None:
+                return outer.wait_done(timeout = timeout)
+            
+            async def wait_done_async(self, *, timeout: float | None = None) -> None:
+                return await outer.wait_done_async(timeout = timeout)
+            
+            def processing(self) -> bool:
+                return outer.processing()
+            
+            def tick(self, interval: float, timeout: float | None = None) -> Iterator[None]:
+                return outer.tick(interval, timeout)
+            
+            def raise_if(self):
+                return outer.raise_if()
+            
+            def drain(self) -> dict[str, BaseException]:
+                return outer.drain()
+            
+            def gather(self) -> list[str]:
+                return outer.gather()
+            
+            def gather_one(self, timeout: float | None = None) -> str:
+                return outer.gather_one(timeout)
+            
+            def poll(self) -> tuple[list[str], dict[str, BaseException]]:
+                return outer.poll()
+            
+            def wait_broken_frame(self, timeout: float | None = None) -> str | None:
+                return outer.wait_broken_frame(timeout)
+            
+            async def wait_broken_frame_async(self, timeout: float | None = None) -> str | None:
+                return await outer.wait_broken_frame_async(timeout)
+            
+            def snapshot(self) -> tuple[list[str], list[str], dict[str, BaseException]]:
+                return outer.snapshot()
+            
+            def iter_finished_frames(self) -> Iterator[str]:
+                return outer.iter_finished_frames()
+            
+            def iter_successful_frames(self) -> Iterator[str]:
+                return outer.iter_successful_frames()
+            
+            def iter_broken_frames(self) -> Iterator[tuple[str, BaseException]]:
+                return outer.iter_broken_frames()
+        
+        return RootFrameFuture()
+
+
+@dataclass(slots = True, kw_only = True)
+class SubFrameExecutorImpl(FrameExecutorImpl):
+    root: RootFrameExecutorImpl
+    interface: SubFrameFuture = field(init = False)
+
+    def __post_init__(self):
+        self.interface = self._create_interface()
+    
+    def _start(self, run_state: FrameRunState):
+        with self.lock:
+            FrameExecutorImpl._start(self, run_state)
+            self.root._on_start_sub_frame()
+
+    def _end(self, circuit_exc: BaseException | None):
+        with self.lock:
+            FrameExecutorImpl._end(self, circuit_exc)
+            self.loop_waiters.notify_unsafe()
+            self.root._on_end_sub_frame(self.frame_name, self.circuit_error)
+    
+    def wait_done(self, *, timeout: float | None = None) -> None:
+        if not self.circuit_is_ended.wait(timeout):
+            raise TimeoutError
+        self._raise_if_failed()
+
+    async def wait_done_async(self, *, timeout: float | None = None) -> None:
+        await self.loop_waiters.wait(self.lock, self.circuit_is_ended.is_set, timeout)
+        self._raise_if_failed()
+
+    def _raise_if_failed(self) -> None:
+        with self.lock:
+            if self.circuit_error is not None:
+                raise SubFrameError(self.frame_name, self.circuit_error)
+
+    def processing(self):
+        return not self.circuit_is_ended.is_set()
+
+    def tick(self, interval: float, timeout: float | None = None) -> Iterator[None]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.circuit_is_ended.is_set():
+            self.circuit_is_ended.wait(_tick_wait(interval, deadline))
+            yield
+
+    def _create_interface(self) -> SubFrameFuture:
+        outer = self
+        class SubFrameFuture:
+            __slots__ = ()
+            @property
+            def frame_name(self) -> str:
+                return outer.frame_name
+            
+            def cancel(self):
+                outer.cancel()
+
+            def wait_done(self, *, timeout: float | None = None) -> None:
+                return outer.wait_done(timeout = timeout)
+            
+            async def wait_done_async(self, *, timeout: float | None = None) -> None:
+                return await outer.wait_done_async(timeout = timeout)
+            
+            def processing(self) -> bool:
+                return outer.processing()
+            
+            def tick(self, interval: float, timeout: float | None = None) -> Iterator[None]:
+                return outer.tick(interval, timeout)
+        
+        return SubFrameFuture()
+
+
+def _tick_wait(interval: float, deadline: float | None) -> float:
+    if deadline is None:
+        return interval
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise TimeoutError
+    # Compared inline; min() is a builtin call on every tick
+    return remaining if remaining < interval else interval
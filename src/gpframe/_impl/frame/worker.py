@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+from typing import Callable
+
+from gpframe._impl.common import _new_event_loop, _default_logger
+
+
+class FrameThreadPool:
+    """Reuses finished frame threads for subsequent frames.
+
+    Each frame still owns a dedicated thread while it is running
+    (a synchronous routine blocks its thread), so the pool is unbounded.
+    Only the thread creation is amortized: a worker whose frame has ended
+    parks on its own job queue and is handed the next frame.
+    Idle workers exit after idle_timeout seconds, closing the event loop
+    they kept for their frames (see acquire_frame_loop).
+    """
+    __slots__ = ("_lock", "_idle", "_idle_timeout")
+    def __init__(self, idle_timeout: float = 60.0):
+        self._lock = threading.Lock()
+        self._idle: list[queue.SimpleQueue] = []
+        self._idle_timeout = idle_timeout
+
+    def submit(self, fn: Callable[[], None]) -> None:
+        with self._lock:
+            if self._idle:
+                # Put under the lock so that an expiring worker can tell
+                # whether it has been picked up.
+                self._idle.pop().put(fn)
+                return
+        jobs = queue.SimpleQueue()
+        jobs.put(fn)
+        thread = threading.Thread(target = self._work, args = (jobs,), daemon = True)
+        thread.start()
+
+    def _work(self, jobs: queue.SimpleQueue) -> None:
+        fn = jobs.get()
+        while True:
+            try:
+                fn()
+            except Exception:
+                # A frame reports its own errors; anything reaching here is a
+                # bug in the frame runner. Log it and keep the worker, but
+                # drop the loop the failed frame may have left running.
+                _default_logger().exception("unhandled error in frame worker")
+                _close_frame_loop()
+            with self._lock:
+                self._idle.append(jobs)
+            try:
+                fn = jobs.get(timeout = self._idle_timeout)
+            except queue.Empty:
+                with self._lock:
+                    if jobs in self._idle:
+                        self._idle.remove(jobs)
+                        _close_frame_loop()
+                        return
+                # Picked up right at the timeout; the job is already queued.
+                fn = jobs.get()
+
+
+_frame_thread_pool = FrameThreadPool()
+
+def submit_frame_worker(fn: Callable[[], None]) -> None:
+    _frame_thread_pool.submit(fn)
+
+
+# A pooled worker runs one frame after another, so it keeps its event loop
+# instead of creating (selector, self-pipe) and closing one per frame.
+_worker_state = threading.local()
+
+def acquire_frame_loop() -> asyncio.AbstractEventLoop:
+    loop = getattr(_worker_state, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = _new_event_loop()
+        _worker_state.loop = loop
+    asyncio.set_event_loop(loop)
+    return loop
+
+def _close_frame_loop() -> None:
+    loop = getattr(_worker_state, "loop", None)
+    if loop is not None:
+        _worker_state.loop = None
+        loop.close()
+
+def release_frame_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Clears what the ended frame left on the loop, as asyncio.run() does
+    before closing, so that none of it can run during the next frame.
+    A loop that cannot be cleared is closed and replaced on next use.
+    """
+    try:
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions = True))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    except BaseException:
+        loop.close()
+        raise
+    finally:
+        asyncio.set_event_loop(None)
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import pickle
+import sys
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any
+
+
+class Packed:
+    """A value pickled once with protocol 5 for a trip through the manager.
+
+    The manager process only stores and forwards the bytes; the object graph
+    is never rebuilt there. Out-of-band buffers (NumPy arrays and other
+    PickleBuffer providers) are kept as separate blocks instead of being
+    copied into the main pickle stream.
+    """
+    __slots__ = ("data", "buffers")
+    def __init__(self, data: bytes, buffers: tuple[bytes, ...]):
+        self.data = data
+        self.buffers = buffers
+    
+    def __reduce__(self):
+        return (Packed, (self.data, self.buffers))
+
+
+class ShmPacked:
+    """A Packed whose out-of-band buffers were moved to a shared memory block.
+
+    Only the pickle stream, the segment name and the buffer offsets travel
+    through the manager. The segment belongs to the map entry holding this
+    value and is unlinked by release() once the entry is replaced or removed.
+    """
+    __slots__ = ("data", "name", "offsets")
+    def __init__(self, data: bytes, name: str, offsets: tuple[tuple[int, int], ...]):
+        self.data = data
+        self.name = name
+        self.offsets = offsets
+    
+    def __reduce__(self):
+        return (ShmPacked, (self.data, self.name, self.offsets))
+
+
+class StaleValueError(LookupError):
+    """The shared memory block of a fetched value was already released.
+
+    The value was replaced after it had been fetched; fetch it again.
+    """
+    __slots__ = ()
+
+
+class MsgPacked:
+    """A value encoded by MsgpackCodec"""
+    __slots__ = ("data",)
+    def __init__(self, data: bytes):
+        self.data = data
+    
+    def __reduce__(self):
+        return (MsgPacked, (self.data,))
+
+
+# Scalars are forwarded as they are; pickling them natively costs less than
+# any wrapper.
+_SCALAR_TYPES = frozenset((int, float, str, bytes, bool, type(None)))
+
+# Short tuples of scalars (coordinates, counters, small records) are
+# immutable like scalars, so they are forwarded natively too: the manager
+# connection pickles them once instead of a pickle inside a pickle.
+_PLAIN_TUPLE_MAX = 16
+
+def _is_plain(value: Any, typ: type) -> bool:
+    if typ in _SCALAR_TYPES:
+        return True
+    if typ is tuple and len(value) <= _PLAIN_TUPLE_MAX:
+        for item in value:
+            if type(item) not in _SCALAR_TYPES:
+                return False
+        return True
+    return False
+
+
+def encode(value: Any) -> Any:
+    if _is_plain(value, type(value)):
+        return value
+    buffers: list[pickle.PickleBuffer] = []
+    data = pickle.dumps(value, protocol = 5, buffer_callback = buffers.append)
+    return Packed(data, tuple(bytes(b.raw()) for b in buffers))
+
+def decode(value: Any) -> Any:
+    # Values that were never encoded (scalars, sentinels, defaults) pass through.
+    typ = type(value)
+    if typ is Packed:
+        return pickle.loads(value.data, buffers = value.buffers)
+    if typ is ShmPacked:
+        return _decode_shm(value)
+    if typ is MsgPacked:
+        import msgpack
+        return msgpack.unpackb(value.data, raw = False, strict_map_key = False)
+    return value
+
+
+def release(value: Any) -> None:
+    """Frees the shared memory block of a value dropped from the map"""
+    if type(value) is not ShmPacked:
+        return
+    _unlink_shm(value.name)
+
+def _unlink_shm(name: str) -> None:
+    try:
+        # Tracked open + unlink() keep the resource tracker balanced.
+        shm = shared_memory.SharedMemory(name)
+    except FileNotFoundError:
+        return
+    shm.close()
+    shm.unlink()
+
+
+def _open_shm(name: str | None = None, size: int = 0) -> shared_memory.SharedMemory:
+    # Segments outlive the process that opened them (they belong to the map
+    # entry), so they must not be registered with the resource tracker,
+    # which would unlink them when that process exits.
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, name is None, size, track = False)
+    shm = shared_memory.SharedMemory(name, name is None, size)
+    resource_tracker.unregister(shm._name, "shared_memory") # type: ignore
+    return shm
+
+
+def _decode_shm(value: ShmPacked) -> Any:
+    try:
+        shm = _open_shm(value.name)
+    except FileNotFoundError:
+        raise StaleValueError(value.name) from None
+    try:
+        # Copied out so the block can be unlinked while the value is alive
+        buffers = [bytearray(shm.buf[offset:offset + size]) for offset, size in value.offsets]
+    finally:
+        shm.close()
+    return pickle.loads(value.data, buffers = buffers)
+
+
+class Codec(ABC):
+    """Encodes ipc message values before they are sent to the manager.
+
+    decode() must accept anything encode() of any codec returns, so
+    registries with different codecs can share one map.
+    """
+    __slots__ = ()
+
+    @abstractmethod
+    def encode(self, value: Any) -> Any:
+        ...
+    
+    def decode(self, value: Any) -> Any:
+        return decode(value)
+
+
+class PickleCodec(Codec):
+    __slots__ = ()
+    def encode(self, value: Any) -> Any:
+        return encode(value)
+
+
+class MsgpackCodec(Codec):
+    """Encodes lists and dicts of msgpack-native values with msgpack.
+
+    Anything msgpack cannot round-trip exactly (tuples, sets, custom
+    objects, out-of-range ints) falls back to the pickle encoding.
+    Requires the optional msgpack package.
+    """
+    __slots__ = ()
+    def __init__(self):
+        import msgpack # noqa: F401  # fail early if msgpack is missing
+    
+    def encode(self, value: Any) -> Any:
+        typ = type(value)
+        if typ is list or typ is dict:
+            import msgpack
+            try:
+                return MsgPacked(msgpack.packb(value, use_bin_type = True, strict_types = True))
+            except (TypeError, ValueError, OverflowError):
+                pass
+        return encode(value)
+
+
+# On Windows a block disappears with its last open handle, so it cannot be
+# handed over through the map.
+_SHM_AVAILABLE = sys.platform != "win32"
+
+class SharedMemoryCodec(Codec):
+    """Moves large out-of-band buffers through shared memory.
+
+    Values whose out-of-band buffers (NumPy arrays and other PickleBuffer
+    providers, or a bytearray value itself) reach threshold bytes are
+    written once into a shared memory block, so the manager only forwards
+    a few hundred bytes per read and write. Smaller values, and every value on Windows, use
+    the in-band pickle encoding, where creating a block would cost more
+    than sending the bytes.
+    """
+    __slots__ = ("_threshold",)
+    def __init__(self, threshold: int = 64 * 1024):
+        self._threshold = threshold
+    
+    def encode(self, value: Any) -> Any:
+        typ = type(value)
+        if _is_plain(value, typ):
+            return value
+        if typ is bytearray and _SHM_AVAILABLE and len(value) >= self._threshold:
+            # bytearray pickles in-band; as a PickleBuffer it goes out of band
+            # and loads() hands back the (copied) bytearray buffer itself.
+            value = pickle.PickleBuffer(value)
+        buffers: list[pickle.PickleBuffer] = []
+        data = pickle.dumps(value, protocol = 5, buffer_callback = buffers.append)
+        raws = [b.raw() for b in buffers]
+        size = sum(raw.nbytes for raw in raws)
+        if not _SHM_AVAILABLE or size < self._threshold:
+            return Packed(data, tuple(bytes(raw) for raw in raws))
+        shm = _open_shm(size = size)
+        try:
+            offsets = []
+            offset = 0
+            for raw in raws:
+                shm.buf[offset:offset + raw.nbytes] = raw
+                offsets.append((offset, raw.nbytes))
+                offset += raw.nbytes
+        except BaseException:
+            shm.close()
+            release(ShmPacked(data, shm.name, ()))
+            raise
+        shm.close()
+        return ShmPacked(data, shm.name, tuple(offsets))
+
+
+DEFAULT_CODEC = PickleCodec()
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import threading
+from typing import Hashable
+
+
+class StripedLock:
+    """A fixed set of locks selected by key hash.
+
+    Operations on a single key only take the stripe that owns the key, so
+    writers on disjoint keys do not serialize on one lock.
+    Using the StripedLock itself as a context manager takes every stripe
+    (always in the same order) for whole-map operations.
+    """
+    __slots__ = ("stripes", "_mask")
+    def __init__(self, n: int = 16):
+        if n < 1 or n & (n - 1):
+            raise ValueError(f"number of stripes must be a power of two: {n}")
+        self.stripes = tuple(threading.Lock() for _ in range(n))
+        self._mask = n - 1
+    
+    def index(self, key: Hashable) -> int:
+        return hash(key) & self._mask
+
+    def __enter__(self):
+        for lock in self.stripes:
+            lock.acquire()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        for lock in reversed(self.stripes):
+            lock.release()
+
+
+class FrozenLock:
+    """A lock that never blocks, for maps that are no longer written.
+
+    Only valid when every write happens before the readers start
+    (e.g. environments, which can only be set while the frame is loading).
+    """
+    __slots__ = ()
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        return True
+    
+    def release(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+
+class ConfinedLock:
+    """A lock that never blocks, for maps confined to a single frame.
+
+    Valid only while accesses never overlap: a frame's routine and its
+    handlers take turns (possibly on different threads) but never run at
+    the same time. In debug mode the holder is recorded so that an
+    overlapping access fails an assertion instead of racing silently.
+    """
+    __slots__ = ("_holder",)
+    def __init__(self):
+        self._holder = None
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        if __debug__:
+            assert self._holder is None, (
+                f"confined map entered by thread {threading.get_ident()} "
+                f"while held by thread {self._holder}"
+            )
+            self._holder = threading.get_ident()
+        return True
+    
+    def release(self) -> None:
+        if __debug__:
+            self._holder = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
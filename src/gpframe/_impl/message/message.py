@@ -0,0 +1,647 @@
+from __future__ import annotations
+
+import pickle
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Generic, cast
+
+
+from gpframe._impl.common import (
+    _K, _T, _D,
+    _noop,
+    _any_str,
+    _any_int,
+    _any_float,
+    _NO_DEFAULT,
+)
+from gpframe._impl.protocols import _DictLike
+from gpframe._impl.message.lock import FrozenLock, StripedLock
+from gpframe._impl.message.prep import compile_prep, needs_validation, bool_table, as_str
+
+if TYPE_CHECKING:
+    from gpframe.contracts.api import message
+
+_PARSED_CACHE_SIZE = 1024
+
+class MessageRegistry(Generic[_K]):
+    __slots__ = (
+        "phase_validator", "_lock", "_key_locks", "_mask", "_map", "_pending", "_updater", "_reader",
+        "_batch", "_batch_owner", "_parsed"
+    )
+    def __init__(
+            self,
+            lock: threading.Lock | StripedLock,
+            map_: _DictLike,
+            phase_validtor: Callable[[], None] | None = None,
+            *,
+            combine_writes: bool = False
+        ):
+        # Warning: Phase check is not performed when passing to subprocess
+        self.phase_validator = phase_validtor if phase_validtor else lambda: None
+        # self._lock guards the whole map. Single-key operations only take
+        # the lock of the stripe that owns the key (the same lock unless a
+        # StripedLock is given).
+        # A StripedLock must not be used for maps shared across processes,
+        # because str hashes differ between processes.
+        self._lock = lock
+        self._key_locks = lock.stripes if isinstance(lock, StripedLock) else (lock,)
+        # Stripe of a key is hash(key) & _mask, computed inline by each
+        # operation; with a single lock the mask is 0 and every key maps to it.
+        self._mask = len(self._key_locks) - 1
+        self._map = map_
+        # Write combining: update() only enqueues and the pending writes are
+        # applied by whoever holds the stripe lock next. Every locked access
+        # flushes first, so readers always observe completed updates.
+        # Must not be enabled for maps shared across processes, because the
+        # queue itself is process local.
+        self._pending: tuple[deque[tuple[Any, Any]], ...] | None = (
+            tuple(deque() for _ in self._key_locks) if combine_writes else None
+        )
+        self._batch = self._create_batch(_noop)
+        # Thread holding a batch, tracked in debug mode only (see _Batch)
+        self._batch_owner: int | None = None
+        # key -> (raw value, (conversion, prep, valid), result) of the last
+        # string_to_* conversion. See _parsed_get().
+        self._parsed: dict[Any, tuple[Any, tuple, Any]] = {}
+        self._reader = self._create_reader()
+        self._updater = self._create_updater(type(self._reader))
+        
+    
+    def update_map_unsafe(self, other: dict):
+        self._map.update(other)
+    
+    def exists(self, key: _K) -> bool:
+        self.phase_validator()
+        if self._pending is None:
+            # A single dict lookup is atomic under the GIL, so membership is
+            # read without the lock; the answer is a snapshot either way.
+            return key in self._map
+        # Pending writes must be applied before they can be observed
+        i = hash(key) & self._mask
+        with self._key_locks[i]:
+            self._flush_unsafe(i)
+            return key in self._map
+    
+    def get_many(self, items: tuple[tuple[_K, type], ...]) -> tuple:
+        # One whole-map lock for every key instead of a stripe lock per
+        # get(), and the values come from a single consistent state.
+        self.phase_validator()
+        map_ = self._map
+        with self._lock:
+            self._flush_all_unsafe()
+            values = tuple([map_.get(key, _NO_DEFAULT) for key, _ in items])
+        _check_many(items, values)
+        return values
+    
+    def geta(self, key: _K, default: Any = _NO_DEFAULT) -> Any:
+        self.phase_validator()
+        i = hash(key) & self._mask
+        with self._key_locks[i]:
+            self._flush_unsafe(i)
+            # EAFP: hits dominate, and they skip the sentinel checks entirely
+            try:
+                return self._map[key]
+            except KeyError:
+                pass
+        if default is _NO_DEFAULT:
+            raise KeyError
+        return default
+    
+    def getd(self, key: _K, typ: type[_T], default: _D) -> _T | _D:
+        self.phase_validator()
+        i = hash(key) & self._mask
+        with self._key_locks[i]:
+            self._flush_unsafe(i)
+            value = self._map.get(key, _NO_DEFAULT)
+        if value is _NO_DEFAULT:
+            return default
+        # Exact type match skips the isinstance() walk in the common case
+        if type(value) is not typ and not isinstance(value, typ):
+            raise TypeError
+        return value
+    
+    def get(self, key: _K, typ: type[_T]) -> _T:
+        self.phase_validator()
+        i = hash(key) & self._mask
+        with self._key_locks[i]:
+            self._flush_unsafe(i)
+            value = self._map[key]
+        if type(value) is not typ and not isinstance(value, typ):
+            raise TypeError
+        return value
+
+    def _flush_unsafe(self, i: int) -> None:
+        # Caller must hold self._key_locks[i]
+        if self._pending is None:
+            return
+        pending = self._pending[i]
+        if pending:
+            map_ = self._map
+            popleft = pending.popleft
+            while True:
+                try:
+                    key, value = popleft()
+                except IndexError:
+                    break
+                map_[key] = value
+
+    def _flush_all_unsafe(self) -> None:
+        # Caller must hold self._lock
+        for i in range(len(self._key_locks)):
+            self._flush_unsafe(i)
+
+    def update(self, key: _K, value: _T) -> _T:
+        self.phase_validator()
+        i = hash(key) & self._mask
+        lock = self._key_locks[i]
+        if self._pending is None:
+            with lock:
+                self._map[key] = value
+                return value
+        self._pending[i].append((key, value))
+        if lock.acquire(False):
+            try:
+                self._flush_unsafe(i)
+            finally:
+                lock.release()
+        return value
+    
+    def set_many(self, items: tuple[tuple[_K, type, Any], ...]) -> None:
+        # One whole-map lock for every key instead of a stripe lock per
+        # write. Every item is checked as swap() checks it before the first
+        # write, so a failure leaves the map untouched. Pending writes are
+        # applied first so they cannot overwrite these later ones.
+        self.phase_validator()
+        map_ = self._map
+        with self._lock:
+            self._flush_all_unsafe()
+            _check_set_many(items, tuple([map_.get(key, _NO_DEFAULT) for key, _, _ in items]))
+            for key, _, value in items:
+                map_[key] = value
+    
+    def apply(self, key: Any, typ: type[_T], fn: Callable[[_T], _T], default: _T | type[_NO_DEFAULT] = _NO_DEFAULT) -> _T:
+        self.phase_validator()
+        i = hash(key) & self._mask
+        with self._key_locks[i]:
+            self._flush_unsafe(i)
+            value = self._map.get(key, _NO_DEFAULT)
+            if value is _NO_DEFAULT:
+                if default is not _NO_DEFAULT:
+                    if type(default) is typ or isinstance(default, typ):
+                        self._map[key] = default
+                    else:
+                        raise TypeError
+                    return default
+                else:
+                    raise KeyError
+            # type() identity first; isinstance() only for subclasses
+            if type(value) is typ or isinstance(value, typ):
+                applied_value = fn(value)
+                if type(applied_value) is not typ and not isinstance(applied_value, typ):
+                    raise TypeError
+                self._map[key] = applied_value
+                return applied_value
+            else:
+                raise TypeError
+    
+    def swap(self, key: _K, typ: type[_T], value: _T) -> _T:
+        # One stripe lock covers both the read and the write, instead of a
+        # get() followed by an update().
+        self.phase_validator()
+        if type(value) is not typ and not isinstance(value, typ):
+            raise TypeError
+        i = hash(key) & self._mask
+        with self._key_locks[i]:
+            self._flush_unsafe(i)
+            old = self._map.get(key, _NO_DEFAULT)
+            if old is _NO_DEFAULT:
+                raise KeyError
+            if type(old) is not typ and not isinstance(old, typ):
+                raise TypeError
+            self._map[key] = value
+            return old
+    
+    def remove(self, key: _K, default: Any = None) -> Any:
+        self.phase_validator()
+        i = hash(key) & self._mask
+        with self._key_locks[i]:
+            self._flush_unsafe(i)
+            return self._map.pop(key, default)
+    
+    def batch(self) -> _Batch:
+        return self._batch
+
+    def _create_batch(self, qualify: Callable[[Any], Any]) -> _Batch:
+        return _Batch(self, qualify)
+
+    # For _Batch, which holds self._lock (every stripe) and has flushed
+    def _get_unsafe(self, key: _K) -> Any:
+        return self._map.get(key, _NO_DEFAULT)
+
+    def _set_unsafe(self, key: _K, value: Any) -> None:
+        self._map[key] = value
+    
+    def _value_with_returns_with_default(self, key: _K, default: Any, typ: type[_T]) -> tuple[_T, bool]:
+        self.phase_validator()
+        i = hash(key) & self._mask
+        with self._key_locks[i]:
+            self._flush_unsafe(i)
+            value = self._map.get(key, _NO_DEFAULT)
+        # One lookup instead of `in` followed by [], and the default is
+        # only examined on a miss, outside the lock.
+        if value is not _NO_DEFAULT:
+            return value, False
+        if type(default) is typ or isinstance(default, typ):
+            return default, True
+        if default is _NO_DEFAULT:
+            raise KeyError
+        return default, False
+    
+    def string(
+        self,
+        key: _K,
+        default: Any = _NO_DEFAULT,
+        *,
+        prep: Callable[[str], str] | tuple[Callable[[str], str], ...] = _noop,
+        valid: Callable[[str], bool] = _any_str,
+    ) -> str:
+        string = as_str(self.geta(key, default))
+        fused = compile_prep(prep)
+        if fused is not None:
+            string = fused(string)
+        if needs_validation(valid) and not valid(string):
+            raise ValueError
+        return string
+
+    def string_to_int(
+        self,
+        key: _K,
+        default: int | Any = _NO_DEFAULT,
+        *,
+        prep: Callable[[str], str] | tuple[Callable[[str], str], ...] = _noop,
+        valid: Callable[[int], bool] = _any_int,
+    ) -> int:
+        value, returns_with_default = self._value_with_returns_with_default(key, default, int)
+        if returns_with_default:
+            return default
+        signature = (int, prep, valid)
+        integer = self._parsed_get(key, value, signature)
+        if integer is not _NO_DEFAULT:
+            return integer
+        string = as_str(value)
+        fused = compile_prep(prep)
+        if fused is not None:
+            string = fused(string)
+        integer = int(string, 0)
+        if needs_validation(valid) and not valid(integer):
+            raise ValueError
+        self._parsed_put(key, value, signature, integer)
+        return integer
+
+    def string_to_float(
+        self,
+        key: _K,
+        default: float | Any = _NO_DEFAULT,
+        *,
+        prep: Callable[[str], str] | tuple[Callable[[str], str], ...] = _noop,
+        valid: Callable[[float], bool] = _any_float,
+    ) -> float:
+        value, returns_with_default = self._value_with_returns_with_default(key, default, float)
+        if returns_with_default:
+            return default
+        signature = (float, prep, valid)
+        float_value = self._parsed_get(key, value, signature)
+        if float_value is not _NO_DEFAULT:
+            return float_value
+        string = as_str(value)
+        fused = compile_prep(prep)
+        if fused is not None:
+            string = fused(string)
+        float_value = float(string)
+        if needs_validation(valid) and not valid(float_value):
+            raise ValueError
+        self._parsed_put(key, value, signature, float_value)
+        return float_value
+
+    def string_to_bool(
+        self,
+        key: _K,
+        default: bool | Any = _NO_DEFAULT,
+        *,
+        prep: Callable[[str], str] | tuple[Callable[[str], str], ...] = _noop,
+        true: tuple[str, ...] = (),
+        false: tuple[str, ...] = (),
+    ) -> bool:
+        value, returns_with_default = self._value_with_returns_with_default(key, default, bool)
+        if returns_with_default:
+            return default
+        signature = (bool, prep, true, false)
+        boolean = self._parsed_get(key, value, signature)
+        if boolean is not _NO_DEFAULT:
+            return boolean
+        string = as_str(value)
+        fused = compile_prep(prep)
+        if fused is not None:
+            string = fused(string)
+        if not true and not false:
+            boolean = bool(string)
+        else:
+            boolean = bool_table(true, false).get(string)
+            if boolean is None:
+                # Unlisted strings: the opposite of the only given side
+                if not false:
+                    boolean = False
+                elif not true:
+                    boolean = True
+                else:
+                    raise ValueError(f"{key}: expected one of {true + false}, but got '{string}'")
+        self._parsed_put(key, value, signature, boolean)
+        return boolean
+
+    def _parsed_get(self, key: _K, value: Any, signature: tuple) -> Any:
+        # Environment and request values are read far more often than they
+        # change, so the last conversion of each key is reused while the raw
+        # value and the arguments stay equal. Returns _NO_DEFAULT on a miss.
+        # Only str values are memoized, so == is always a plain comparison.
+        # Maps that keep the stored object (environments above all) hand back
+        # the same str on every read, so identity settles the hit without
+        # comparing characters.
+        if type(value) is not str:
+            return _NO_DEFAULT
+        memo = self._parsed.get(key)
+        if memo is None:
+            return _NO_DEFAULT
+        cached = memo[0]
+        if (cached is value or cached == value) and memo[1] == signature:
+            return memo[2]
+        return _NO_DEFAULT
+    
+    def _parsed_put(self, key: _K, value: Any, signature: tuple, result: Any) -> None:
+        parsed = self._parsed
+        if type(value) is str and (key in parsed or len(parsed) < _PARSED_CACHE_SIZE):
+            parsed[key] = (value, signature, result)
+        
+    
+    def __str__(self):
+        self.phase_validator()
+        with self._lock:
+            self._flush_all_unsafe()
+            return str(self._map)
+
+    def _create_reader(self) -> message.MessageReader[_K]:
+        outer = self
+        # The message protocols are structural; the facades satisfy them
+        # without deriving from them.
+        class _Reader:
+            __slots__ = ()
+            def exists(self, key: _K) -> bool:
+                return outer.exists(key)
+            def get_many(self, items: tuple[tuple[_K, type], ...]) -> tuple:
+                return outer.get_many(items)
+            def geta(self, key: _K, default: Any = _NO_DEFAULT) -> Any:
+                return outer.geta(key, default)
+            def getd(self, key: _K, typ: type[_T], default: _D) -> _T | _D:
+                return outer.getd(key, typ, default)
+            def get(self, key: _K, typ: type[_T]) -> _T:
+                return outer.get(key, typ)
+            def string(
+                self,
+                key: Any,
+                default: Any = _NO_DEFAULT,
+                *,
+                prep: Callable[[str], str] | tuple[Callable[[str], str], ...] = _noop,
+                valid: Callable[[str], bool] = _any_str,
+            ) -> str:
+                return outer.string(key, default, prep = prep, valid = valid)
+            def string_to_int(
+                self,
+                key: _K,
+                default: int | Any = _NO_DEFAULT,
+                *,
+                prep: Callable[[str], str] | tuple[Callable[[str], str], ...] = _noop,
+                valid: Callable[[int], bool] = _any_int,
+            ) -> int:
+                return outer.string_to_int(key, default, prep = prep, valid = valid)
+            def string_to_float(
+                self,
+                key: _K,
+                default: float | Any = _NO_DEFAULT,
+                *,
+                prep: Callable[[str], str] | tuple[Callable[[str], str], ...] = _noop,
+                valid: Callable[[float], bool] = _any_float,
+            ) -> float:
+                return outer.string_to_float(key, default, prep = prep, valid = valid)
+            def string_to_bool(
+                self,
+                key: _K,
+                default: bool | Any = _NO_DEFAULT,
+                *,
+                prep: Callable[[str], str] | tuple[Callable[[str], str], ...] = _noop,
+                true: tuple[str, ...] = (),
+                false: tuple[str, ...] = (),
+            ) -> bool:
+                return outer.string_to_bool(key, default, prep = prep, true = true, false = false)
+            def __str__(self):
+                return outer.__str__()
+            def __reduce__(self):
+                outer.phase_validator()
+                with outer._lock:
+                    outer._flush_all_unsafe()
+                    return (_create_message_reader, (type(outer), outer._reduce_args()))
+
+        return _Reader()
+
+    def _create_updater(self, reader_type: type[message.MessageReader[_K]]) -> message.MessageUpdater[_K]:
+        outer = self
+        class _Updater(reader_type):
+            __slots__ = ()
+            def update(self, key: _K, value: _T) -> _T:
+                return outer.update(key, value)
+            def set_many(self, items: tuple[tuple[_K, type, Any], ...]) -> None:
+                outer.set_many(items)
+            def apply(self, key: _K, typ: type[_T], fn: Callable[[_T], _T], default: _T | type[_NO_DEFAULT] = _NO_DEFAULT) -> _T:
+                return outer.apply(key, typ, fn, default)
+            def swap(self, key: _K, typ: type[_T], value: _T) -> _T:
+                return outer.swap(key, typ, value)
+            def remove(self, key: _K, default: Any = None) -> Any:
+                return outer.remove(key, default)
+            def batch(self) -> _Batch:
+                return outer._batch
+            def __reduce__(self):
+                outer.phase_validator()
+                with outer._lock:
+                    outer._flush_all_unsafe()
+                    return (_create_message_updater, (type(outer), outer._reduce_args()))
+
+        return _Updater() # type: ignore
+
+    
+    @property
+    def updater(self) -> message.MessageUpdater[_K]:
+        return self._updater
+    
+    @property
+    def reader(self) -> message.MessageReader[_K]:
+        return self._reader
+    
+    def _reduce_args(self) -> tuple:
+        return (self._lock, self._map)
+
+    def __reduce__(self):
+        return (type(self), self._reduce_args())
+
+
+class FrozenMessageRegistry(MessageRegistry[_K]):
+    """A MessageRegistry over a map that is no longer written once readers start.
+
+    Used for environments, which are only written while the frame is loading.
+    Reads go straight to the map: no lock and no write-combining flush.
+    """
+    __slots__ = ("_pickled_map",)
+    def __init__(self, map_: _DictLike | bytes, phase_validtor: Callable[[], None] | None = None):
+        if type(map_) is bytes:
+            # Unpickled in a child process (see _reduce_args)
+            map_ = pickle.loads(map_)
+        super().__init__(FrozenLock(), map_, phase_validtor)
+        self._pickled_map: bytes | None = None
+    
+    def geta(self, key: _K, default: Any = _NO_DEFAULT) -> Any:
+        self.phase_validator()
+        try:
+            return self._map[key]
+        except KeyError:
+            pass
+        if default is _NO_DEFAULT:
+            raise KeyError
+        return default
+    
+    def getd(self, key: _K, typ: type[_T], default: _D) -> _T | _D:
+        self.phase_validator()
+        value = self._map.get(key, _NO_DEFAULT)
+        if value is _NO_DEFAULT:
+            return default
+        if type(value) is not typ and not isinstance(value, typ):
+            raise TypeError
+        return value
+    
+    def get(self, key: _K, typ: type[_T]) -> _T:
+        self.phase_validator()
+        value = self._map[key]
+        if type(value) is not typ and not isinstance(value, typ):
+            raise TypeError
+        return value
+    
+    def get_many(self, items: tuple[tuple[_K, type], ...]) -> tuple:
+        self.phase_validator()
+        map_ = self._map
+        values = tuple([map_.get(key, _NO_DEFAULT) for key, _ in items])
+        _check_many(items, values)
+        return values
+    
+    def _value_with_returns_with_default(self, key: _K, default: Any, typ: type[_T]) -> tuple[_T, bool]:
+        self.phase_validator()
+        value = self._map.get(key, _NO_DEFAULT)
+        if value is not _NO_DEFAULT:
+            return value, False
+        if type(default) is typ or isinstance(default, typ):
+            return default, True
+        if default is _NO_DEFAULT:
+            raise KeyError
+        return default, False
+    
+    def __str__(self):
+        self.phase_validator()
+        return str(self._map)
+    
+    def _reduce_args(self) -> tuple:
+        # Every sub-frame started in a spawned process carries the
+        # environments in its context. The map is pickled once, on the
+        # first transfer (which happens after loading, so the map is
+        # final), and each later context copies these bytes instead of
+        # pickling every value again.
+        pickled = self._pickled_map
+        if pickled is None:
+            pickled = pickle.dumps(self._map, protocol = pickle.HIGHEST_PROTOCOL)
+            self._pickled_map = pickled
+        return (pickled,)
+
+
+class _Batch:
+    """Context manager and operator returned by MessageRegistry.batch()
+
+    Holds the whole-map lock inside the with block. It keeps no per-use
+    state, so each registry reuses one instance and entering a batch
+    creates no generator or other object.
+    Only existing keys can be read or written.
+    """
+    __slots__ = ("_registry", "_qualify")
+    def __init__(self, registry: MessageRegistry, qualify: Callable[[Any], Any]):
+        self._registry = registry
+        self._qualify = qualify
+    
+    def __enter__(self) -> _Batch:
+        registry = self._registry
+        registry.phase_validator()
+        if __debug__:
+            # The map lock is not reentrant; a nested batch on the same
+            # registry would deadlock instead of failing.
+            assert registry._batch_owner != threading.get_ident(), "nested batch on the same message"
+        registry._lock.__enter__()
+        if __debug__:
+            registry._batch_owner = threading.get_ident()
+        registry._flush_all_unsafe()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        registry = self._registry
+        if __debug__:
+            registry._batch_owner = None
+        registry._lock.__exit__(exc_type, exc, tb)
+
+    def exists_key(self, key: Any) -> bool:
+        return self._registry._get_unsafe(self._qualify(key)) is not _NO_DEFAULT
+    
+    def get_value(self, key: Any, typ: type[_T]) -> _T:
+        value = self._registry._get_unsafe(self._qualify(key))
+        if value is _NO_DEFAULT:
+            raise KeyError
+        if type(value) is not typ and not isinstance(value, typ):
+            raise TypeError
+        return value
+    
+    def set_value(self, key: Any, value: Any) -> None:
+        qualified = self._qualify(key)
+        registry = self._registry
+        if registry._get_unsafe(qualified) is _NO_DEFAULT:
+            raise KeyError
+        registry._set_unsafe(qualified, value)
+
+
+def _check_many(items: tuple[tuple[Any, type], ...], values: tuple) -> None:
+    for (key, typ), value in zip(items, values):
+        if value is _NO_DEFAULT:
+            raise KeyError
+        if type(value) is not typ and not isinstance(value, typ):
+            raise TypeError
+
+def _check_set_many(items: tuple[tuple[Any, type, Any], ...], current: tuple) -> None:
+    for (key, typ, value), old in zip(items, current):
+        if old is _NO_DEFAULT:
+            raise KeyError
+        if type(old) is not typ and not isinstance(old, typ):
+            raise TypeError
+        if type(value) is not typ and not isinstance(value, typ):
+            raise TypeError
+
+def _create_message_updater(
+        cls: type[MessageRegistry],
+        args: tuple
+) -> message.MessageUpdater:
+    return cls(*args).updater
+
+def _create_message_reader(
+        cls: type[MessageRegistry],
+        args: tuple
+) -> message.MessageReader:
+    return cls(*args).reader
+
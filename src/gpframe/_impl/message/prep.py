@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Callable
+
+from gpframe._impl.common import _noop, _any_str, _any_int, _any_float
+
+Prep = Callable[[str], str] | tuple[Callable[[str], str], ...]
+
+def _fuse(prep: tuple[Callable[[str], str], ...]) -> Callable[[str], str]:
+    # One flat function instead of a nested lambda per step: a chain of N
+    # steps costs one extra frame, not N. No-op steps are dropped.
+    steps = tuple(fn for fn in prep if fn is not _noop)
+    if not steps:
+        return _identity
+    if len(steps) == 1:
+        return steps[0]
+    if len(steps) == 2:
+        f, g = steps
+        return lambda string: g(f(string))
+    if len(steps) == 3:
+        f, g, h = steps
+        return lambda string: h(g(f(string)))
+    def fused(string: str) -> str:
+        for fn in steps:
+            string = fn(string)
+        return string
+    return fused
+
+def _identity(string: str) -> str:
+    return string
+
+@lru_cache(maxsize = 256)
+def _fuse_cached(prep: tuple[Callable[[str], str], ...]) -> Callable[[str], str]:
+    return _fuse(prep)
+
+def compile_prep(prep: Prep) -> Callable[[str], str] | None:
+    """Returns prep as a single callable, or None if prep does nothing.
+
+    A tuple of callables is fused into one callable once and cached by the
+    tuple, so repeated reads with the same prep do not rebuild the chain.
+    """
+    if prep is _noop:
+        return None
+    if not isinstance(prep, tuple):
+        return prep
+    if not prep:
+        return None
+    try:
+        return _fuse_cached(prep)
+    except TypeError:
+        # unhashable element
+        return _fuse(prep)
+
+def needs_validation(valid: Callable[[Any], bool]) -> bool:
+    # The default validators accept everything
+    return not (valid is _any_int or valid is _any_float or valid is _any_str)
+
+def _bool_table(true: tuple[str, ...], false: tuple[str, ...]) -> dict[str, bool]:
+    table = dict.fromkeys(false, False)
+    # true wins when a string is listed in both
+    table.update(dict.fromkeys(true, True))
+    return table
+
+@lru_cache(maxsize = 256)
+def _bool_table_cached(true: tuple[str, ...], false: tuple[str, ...]) -> dict[str, bool]:
+    return _bool_table(true, false)
+
+def bool_table(true: tuple[str, ...], false: tuple[str, ...]) -> dict[str, bool]:
+    """Returns one string -> bool table for a (true, false) pair
+
+    A single dict lookup then replaces the separate membership tests on
+    true and false.
+    """
+    try:
+        return _bool_table_cached(true, false)
+    except TypeError:
+        # unhashable element
+        return _bool_table(true, false)
+
+def as_str(value: Any) -> str:
+    return value if type(value) is str else str(value)
@@ -0,0 +1,182 @@
+
+from __future__ import annotations
+
+import sys
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable
+
+from gpframe._impl.message.message import MessageRegistry, _Batch
+from gpframe._impl.common import _NO_DEFAULT, _D, _T, _any_float, _any_int, _any_str, _noop
+
+if TYPE_CHECKING:
+    from gpframe.contracts.api import message
+    MessageReader = message.MessageReader
+    MessageUpdater = message.MessageUpdater
+
+class MessageReflector:
+    __slots__ = ("_reader", "_updater")
+
+    def __init__(self, namespace: str, message: MessageRegistry[str]):
+        qualify = _create_key_qualifier(namespace)
+        self._reader = self._create_ipc_message_reader_reflector(
+            namespace,
+            qualify,
+            message
+        )
+        self._updater = self._create_ipc_message_updater_reflector(
+            namespace,
+            qualify,
+            self._reader,
+            message
+        )
+    
+    @property
+    def reader(self) -> MessageReader[str]:
+        return self._reader
+    
+    @property
+    def updater(self) -> MessageUpdater[str]:
+        return self._updater
+
+    def _create_ipc_message_reader_reflector(
+            self,
+            namespace: str,
+            qualify: Callable[[str], str],
+            message: MessageRegistry[str]
+    ) -> MessageReader[str]:
+        
+        class _Interface:
+            __slots__ = ()
+            def exists(self, key: str) -> bool:
+                return message.exists(qualify(key))
+            
+            def get_many(self, items: tuple[tuple[str, type], ...]) -> tuple:
+                return message.get_many(tuple([(qualify(key), typ) for key, typ in items]))
+            
+            def geta(self, key: str, default: Any = _NO_DEFAULT) -> Any:
+                return message.geta(qualify(key), default)
+            
+            def getd(self, key: str, typ: type[_T], default: _D) -> _T | _D:
+                return message.getd(qualify(key), typ, default)
+            def get(self, key: str, typ: type[_T]) -> _T:
+                return message.get(qualify(key), typ)
+            def string(
+                self,
+                key: str,
+                default: Any = _NO_DEFAULT,
+                *,
+                prep: Callable[[str], str] | tuple[Callable[[str], str], ...] = _noop,
+                valid: Callable[[str], bool] = _any_str,
+            ) -> str:
+                return message.string(qualify(key), default, prep = prep, valid = valid)
+            def string_to_int(
+                self,
+                key: str,
+                default: int | Any = _NO_DEFAULT,
+                *,
+                prep: Callable[[str], str] | tuple[Callable[[str], str], ...] = _noop,
+                valid: Callable[[int], bool] = _any_int,
+            ) -> int:
+                return message.string_to_int(qualify(key), default, prep = prep, valid = valid)
+            def string_to_float(
+                self,
+                key: str,
+                default: float | Any = _NO_DEFAULT,
+                *,
+                prep: Callable[[str], str] | tuple[Callable[[str], str], ...] = _noop,
+                valid: Callable[[float], bool] = _any_float,
+            ) -> float:
+                return message.string_to_float(qualify(key), default, prep = prep, valid = valid)
+            def string_to_bool(
+                self,
+                key: str,
+                default: bool | Any = _NO_DEFAULT,
+                *,
+                prep: Callable[[str], str] | tuple[Callable[[str], str], ...] = _noop,
+                true: tuple[str, ...] = (),
+                false: tuple[str, ...] = (),
+            ) -> bool:
+                return message.string_to_bool(qualify(key), default, prep = prep, true = true, false = false)
+            
+            def __reduce__(self):
+                return (_reduce_reader, (namespace, message))
+
+        return _Interface()
+
+    def _create_ipc_message_updater_reflector(
+            self,
+            namespace: str,
+            qualify: Callable[[str], str],
+            reader: MessageReader[str],
+            message: MessageRegistry[str]
+    ) -> MessageUpdater[str]:
+        
+        batch = message._create_batch(qualify)
+
+        class _Interface(type(reader)):
+            __slots__ = ()
+            def update(self, key: str, value: _T) -> _T:
+                return message.update(qualify(key), value)
+            
+            def set_many(self, items: tuple[tuple[str, type, Any], ...]) -> None:
+                message.set_many(tuple([(qualify(key), typ, value) for key, typ, value in items]))
+            
+            def apply(self, key: str, typ: type[_T], fn: Callable[[_T], _T], default: _T | type[_NO_DEFAULT] = _NO_DEFAULT) -> _T:
+                return message.apply(qualify(key), typ, fn, default)
+            
+            def swap(self, key: str, typ: type[_T], value: _T) -> _T:
+                return message.swap(qualify(key), typ, value)
+            
+            def remove(self, key: str, default: Any = None) -> Any:
+                return message.remove(qualify(key), default)
+            
+            def batch(self) -> _Batch:
+                return batch
+            
+            def __reduce__(self):
+                return (_reduce_updater, (namespace, message))
+        
+        return _Interface() # type: ignore
+
+# Namespaced keys are rebuilt from the same few user keys on every access.
+# Caching them skips the concatenation and keeps the str hash cached
+# for the registry lookup.
+_QUALIFIED_KEY_CACHE_SIZE = 1024
+
+def _create_key_qualifier(namespace: str) -> Callable[[str], str]:
+    qualified: dict[str, str] = {}
+    # id(member) -> (member, qualified key). Enum hashing and str() run in
+    # Python code, so members are looked up by identity instead; holding the
+    # member keeps its id from being reused.
+    qualified_members: dict[int, tuple[Enum, str]] = {}
+    def qualify(key: str) -> str:
+        # Only exact str keys are cached; 1 == True would collide otherwise.
+        if type(key) is not str:
+            entry = qualified_members.get(id(key))
+            if entry is not None and entry[0] is key:
+                return entry[1]
+            q = namespace + str(key)
+            if isinstance(key, Enum) and len(qualified_members) < _QUALIFIED_KEY_CACHE_SIZE:
+                q = sys.intern(q)
+                qualified_members[id(key)] = (key, q)
+            return q
+        q = qualified.get(key)
+        if q is None:
+            q = namespace + key
+            if len(qualified) < _QUALIFIED_KEY_CACHE_SIZE:
+                # Cached keys are a bounded set, so interning them is safe
+                q = sys.intern(q)
+                qualified[key] = q
+        return q
+    return qualify
+
+def _reduce_reader(namespace: str, message: MessageRegistry[str]):
+    refl = MessageReflector(namespace, message)
+    return refl.reader
+
+def _reduce_updater(namespace: str, message: MessageRegistry[str]):
+    refl = MessageReflector(namespace, message)
+    return refl.updater
+
+
+
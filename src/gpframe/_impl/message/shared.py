@@ -0,0 +1,515 @@
+from __future__ import annotations
+
+import threading
+from multiprocessing import shared_memory, util
+from multiprocessing.managers import SyncManager, AcquirerProxy
+from struct import pack_into, unpack_from
+from typing import Any, Callable
+
+from gpframe._impl.common import _K, _T, _D, _NO_DEFAULT
+
+from gpframe._impl.message.message import MessageRegistry, _Batch, _check_many, _check_set_many
+from gpframe._impl.message.codec import Codec, DEFAULT_CODEC, StaleValueError, release, _open_shm, _unlink_shm, _SHM_AVAILABLE
+
+
+class SharedMessageMap:
+    """Message map held by the manager process.
+
+    Single-key operations take the map lock inside the manager process, so
+    each of them costs one round trip instead of three
+    (lock acquire, dict operation and lock release through separate proxies).
+
+    Every write stamps the key with a new version so that readers holding
+    an unchanged value can skip its transfer (see get_if_changed).
+    The latest version is also published in a shared memory block, so a
+    reader can tell that nothing was written without a round trip at all.
+    """
+    __slots__ = ("_lock", "_map", "_versions", "_version", "_written", "__weakref__")
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._map: dict = {}
+        self._versions: dict = {}
+        self._version = 0
+        self._written: shared_memory.SharedMemory | None = None
+        if _SHM_AVAILABLE:
+            # Untracked like the value blocks: readers attach and detach
+            # from other processes, and the map frees it (see _close_map).
+            written = _open_shm(size = 8)
+            pack_into("Q", written.buf, 0, 0)
+            self._written = written
+        # The map owns the shared memory blocks of its values (see
+        # ShmPacked), which are not tracked by any process. They are freed
+        # when the map is dropped or the manager process exits, even if the
+        # frame never got to clear(). util.Finalize is used because manager
+        # processes exit without running atexit.
+        util.Finalize(self, _close_map, (self._map, self._written), exitpriority = 0)
+    
+    def get_lock(self) -> threading.Lock:
+        return self._lock
+    
+    def get_written_name(self) -> str | None:
+        """Name of the block holding the latest version, None if unavailable"""
+        return self._written.name if self._written is not None else None
+    
+    def get(self, key: Any, default: Any = _NO_DEFAULT) -> Any:
+        with self._lock:
+            return self._map.get(key, default)
+    
+    def get_if_changed(self, key: Any, version: int) -> tuple[int, bool, Any]:
+        """Returns (version, changed, value); value is only sent if changed.
+
+        Version 0 means the key is missing.
+        """
+        with self._lock:
+            current = self._versions.get(key, 0)
+            if current == version:
+                return current, False, None
+            return current, True, self._map.get(key, _NO_DEFAULT)
+    
+    def get_version(self, key: Any) -> int:
+        """Version of the key, 0 if missing; the value is not sent"""
+        with self._lock:
+            return self._versions.get(key, 0)
+    
+    def get_many_if_changed(self, requests: list[tuple[Any, int]]) -> list[tuple[int, bool, Any]]:
+        """get_if_changed() for several (key, version) pairs in one call"""
+        replies = []
+        with self._lock:
+            for key, version in requests:
+                current = self._versions.get(key, 0)
+                if current == version:
+                    replies.append((current, False, None))
+                else:
+                    replies.append((current, True, self._map.get(key, _NO_DEFAULT)))
+        return replies
+    
+    def set(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self.set_unsafe(key, value)
+    
+    def pop(self, key: Any, default: Any = None) -> Any:
+        # The caller owns the popped value and releases it after decoding.
+        with self._lock:
+            self._count_write_unsafe()
+            self._versions.pop(key, None)
+            return self._map.pop(key, default)
+    
+    def swap_if_version(self, key: Any, value: Any, version: int) -> bool:
+        """Replaces the value only if the key is still at version.
+
+        Returns False without writing if the key was written or removed in
+        the meantime. The replaced value is released here; the caller has
+        already decoded its own copy.
+        """
+        with self._lock:
+            if version == 0 or self._versions.get(key, 0) != version:
+                return False
+            self.set_unsafe(key, value)
+            return True
+    
+    def update(self, other: dict) -> None:
+        with self._lock:
+            for key, value in other.items():
+                self.set_unsafe(key, value)
+    
+    def copy(self) -> dict:
+        with self._lock:
+            return dict(self._map)
+    
+    def clear(self) -> None:
+        with self._lock:
+            for value in self._map.values():
+                release(value)
+            self._map.clear()
+            self._versions.clear()
+            self._count_write_unsafe()
+    
+    # For callers already holding the lock returned by get_lock()
+    def get_unsafe(self, key: Any, default: Any = _NO_DEFAULT) -> Any:
+        return self._map.get(key, default)
+
+    def get_version_unsafe(self, key: Any) -> int:
+        return self._versions.get(key, 0)
+
+    def update_unsafe(self, other: dict) -> None:
+        for key, value in other.items():
+            self.set_unsafe(key, value)
+
+    def set_unsafe(self, key: Any, value: Any) -> None:
+        self._count_write_unsafe()
+        self._versions[key] = self._version
+        old = self._map.get(key)
+        self._map[key] = value
+        # Frees the shared memory block of a replaced value (see ShmPacked)
+        release(old)
+
+    def _count_write_unsafe(self) -> None:
+        self._version += 1
+        if self._written is not None:
+            pack_into("Q", self._written.buf, 0, self._version)
+
+
+# Published in place of the version once the map is gone, so readers that
+# are still attached stop trusting their cached values.
+_MAP_CLOSED = 0xFFFF_FFFF_FFFF_FFFF
+
+def _close_map(map_: dict, written: shared_memory.SharedMemory | None) -> None:
+    for value in map_.values():
+        release(value)
+    map_.clear()
+    if written is not None:
+        pack_into("Q", written.buf, 0, _MAP_CLOSED)
+        written.close()
+        _unlink_shm(written.name)
+
+
+class MessageSyncManager(SyncManager):
+    pass
+
+# Proxy type for the lock returned by SharedMessageMap.get_lock()
+MessageSyncManager.register(
+    "_SharedMessageMapLock",
+    proxytype = AcquirerProxy,
+    create_method = False,
+)
+MessageSyncManager.register(
+    "SharedMessageMap",
+    SharedMessageMap,
+    exposed = ("get_lock", "get_written_name", "get", "get_if_changed", "get_version", "get_many_if_changed", "set", "swap_if_version", "pop", "update", "copy", "clear", "get_unsafe", "get_version_unsafe", "set_unsafe", "update_unsafe"),
+    method_to_typeid = {"get_lock": "_SharedMessageMapLock"},
+)
+
+
+_FETCHED_CACHE_SIZE = 1024
+
+class SharedMessageRegistry(MessageRegistry[_K]):
+    """MessageRegistry backed by a SharedMessageMap proxy
+
+    Values are encoded by the codec before they are sent and decoded by the
+    reader.
+    """
+    __slots__ = ("_codec", "_fetched", "_written")
+    def __init__(
+            self,
+            shared_map: SharedMessageMap,
+            phase_validtor: Callable[[], None] | None = None,
+            lock: Any = None,
+            codec: Codec = DEFAULT_CODEC,
+        ):
+        # An unpickled proxy cannot create new proxies, so the lock proxy
+        # travels together with the map proxy (see _reduce_args).
+        if lock is None:
+            lock = shared_map.get_lock()
+        super().__init__(lock, shared_map, phase_validtor) # type: ignore
+        self._codec = codec
+        # key -> (version, encoded value, map version when last validated)
+        # of the last value read by this process. Values are kept encoded
+        # and decoded on every read, so callers never share a mutable object.
+        self._fetched: dict[Any, tuple[int, Any, int | None]] = {}
+        # Block holding the map version (see SharedMessageMap), attached on
+        # the first read; False if the map does not publish one.
+        self._written: shared_memory.SharedMemory | bool | None = None
+    
+    def _reduce_args(self) -> tuple:
+        return (self._map, None, self._lock, self._codec)
+    
+    def exists(self, key: _K) -> bool:
+        # Membership only needs the version, so the value is never sent
+        self.phase_validator()
+        known = self._fetched.get(key)
+        written = self._map_version()
+        if known is not None and written is not None and known[2] == written:
+            return True
+        version = self._map.get_version(key)
+        if known is not None and known[0] == version:
+            # Still the cached value; later reads can skip the round trip
+            self._fetched[key] = (version, known[1], written)
+        return version != 0
+    
+    def geta(self, key: _K, default: Any = _NO_DEFAULT) -> Any:
+        self.phase_validator()
+        value = self._read(key)
+        if value is _NO_DEFAULT:
+            if default is _NO_DEFAULT:
+                raise KeyError
+            return default
+        return value
+    
+    def getd(self, key: _K, typ: type[_T], default: _D) -> _T | _D:
+        self.phase_validator()
+        value = self._read(key)
+        if value is _NO_DEFAULT:
+            return default
+        if type(value) is not typ and not isinstance(value, typ):
+            raise TypeError
+        return value
+    
+    def get(self, key: _K, typ: type[_T]) -> _T:
+        self.phase_validator()
+        value = self._read(key)
+        if value is _NO_DEFAULT:
+            raise KeyError
+        if type(value) is not typ and not isinstance(value, typ):
+            raise TypeError
+        return value
+    
+    def _read(self, key: _K) -> Any:
+        while True:
+            try:
+                return self._codec.decode(self._fetch(key))
+            except StaleValueError:
+                # Replaced between the fetch and the decode; the next fetch
+                # sees the new version.
+                pass
+
+    def _fetch(self, key: _K) -> Any:
+        known = self._fetched.get(key)
+        written = self._map_version()
+        if known is not None and written is not None and known[2] == written:
+            # Nothing was written to the map since this value was validated
+            return known[1]
+        # Unchanged values are not transferred again; only the version is.
+        return self._refresh(key, known, written, self._map.get_if_changed(key, known[0] if known else 0))
+
+    def _refresh(self, key: _K, known: tuple[int, Any, int | None] | None, written: int | None, reply: tuple[int, bool, Any]) -> Any:
+        # written is the map version read before the request, so the reply
+        # is at least that recent.
+        version, changed, value = reply
+        fetched = self._fetched
+        if not changed:
+            if known is None:
+                return _NO_DEFAULT
+            fetched[key] = (version, known[1], written)
+            return known[1]
+        if version == 0:
+            fetched.pop(key, None)
+        elif known or len(fetched) < _FETCHED_CACHE_SIZE:
+            fetched[key] = (version, value, written)
+        return value
+
+    def _map_version(self) -> int | None:
+        written = self._written
+        if written is None:
+            name = self._map.get_written_name()
+            written = _open_shm(name) if name is not None else False
+            self._written = written
+        if written is False:
+            return None
+        version = unpack_from("Q", written.buf)[0] # type: ignore
+        if version == _MAP_CLOSED:
+            return None
+        return version
+
+    def close(self) -> None:
+        """Detaches from the map version block; later reads ask the manager"""
+        written = self._written
+        self._written = False
+        if written:
+            written.close() # type: ignore
+
+    def get_many(self, items: tuple[tuple[_K, type], ...]) -> tuple:
+        self.phase_validator()
+        values = self._read_many([key for key, _ in items])
+        _check_many(items, values)
+        return values
+
+    def _read_many(self, keys: list) -> tuple:
+        # Every key in one round trip, versioned like single reads
+        fetched = self._fetched
+        known = [fetched.get(key) for key in keys]
+        written = self._map_version()
+        if written is not None and all(k is not None and k[2] == written for k in known):
+            # Nothing was written since every value was validated
+            replies = [(k[0], False, None) for k in known] # type: ignore
+        else:
+            replies = self._map.get_many_if_changed(
+                [(key, k[0] if k else 0) for key, k in zip(keys, known)]
+            )
+        values = []
+        for key, k, reply in zip(keys, known, replies):
+            try:
+                values.append(self._codec.decode(self._refresh(key, k, written, reply)))
+            except StaleValueError:
+                values.append(self._read(key))
+        return tuple(values)
+
+    def update(self, key: _K, value: _T) -> _T:
+        self.phase_validator()
+        self._map.set(key, self._codec.encode(value))
+        return value
+    
+    def set_many(self, items: tuple[tuple[_K, type, Any], ...]) -> None:
+        # The current values are checked with one read (usually served from
+        # the local cache), then every value is encoded here and sent in a
+        # single update() call, so the manager lock is taken once and there
+        # is one round trip. As with update(), the write is not ordered
+        # against writes from other processes made after the check.
+        self.phase_validator()
+        _check_set_many(items, self._read_many([key for key, _, _ in items]))
+        encode = self._codec.encode
+        encoded = {}
+        try:
+            for key, _, value in items:
+                if key in encoded:
+                    # Listed twice; the last value wins
+                    release(encoded.pop(key))
+                encoded[key] = encode(value)
+        except BaseException:
+            for value in encoded.values():
+                release(value)
+            raise
+        self._map.update(encoded)
+    
+    def apply(self, key: Any, typ: type[_T], fn: Callable[[_T], _T], default: _T | type[_NO_DEFAULT] = _NO_DEFAULT) -> _T:
+        self.phase_validator()
+        shared_map = self._map
+        with self._lock:
+            value = self._codec.decode(shared_map.get_unsafe(key))
+            if value is _NO_DEFAULT:
+                if default is not _NO_DEFAULT:
+                    if type(default) is typ or isinstance(default, typ):
+                        shared_map.set_unsafe(key, self._codec.encode(default))
+                    else:
+                        raise TypeError
+                    return default
+                else:
+                    raise KeyError
+            if type(value) is typ or isinstance(value, typ):
+                applied_value = fn(value)
+                if type(applied_value) is not typ and not isinstance(applied_value, typ):
+                    raise TypeError
+                shared_map.set_unsafe(key, self._codec.encode(applied_value))
+                return applied_value
+            else:
+                raise TypeError
+    
+    def swap(self, key: _K, typ: type[_T], value: _T) -> _T:
+        # Compare-and-swap on the key version: the old value is decoded and
+        # type-checked here, and the new one is only stored if no other
+        # write came in between. A missing key or a type mismatch leaves the
+        # map untouched, as with the in-process registry. The map lock is
+        # not taken through its proxy.
+        self.phase_validator()
+        if type(value) is not typ and not isinstance(value, typ):
+            raise TypeError
+        encoded = self._codec.encode(value)
+        stored = False
+        try:
+            while True:
+                known = self._fetched.get(key)
+                written = self._map_version()
+                if known is not None and written is not None and known[2] == written:
+                    version, current = known[0], known[1]
+                else:
+                    reply = self._map.get_if_changed(key, known[0] if known else 0)
+                    version = reply[0]
+                    current = self._refresh(key, known, written, reply)
+                if version == 0:
+                    raise KeyError
+                try:
+                    old = self._codec.decode(current)
+                except StaleValueError:
+                    # Replaced after the read; the next read sees it
+                    continue
+                if type(old) is not typ and not isinstance(old, typ):
+                    raise TypeError
+                if self._map.swap_if_version(key, encoded, version):
+                    stored = True
+                    return old
+        finally:
+            if not stored:
+                release(encoded)
+    
+    def _create_batch(self, qualify: Callable[[Any], Any]) -> _Batch:
+        return _SharedBatch(self, qualify)
+
+    def _get_unsafe(self, key: _K) -> Any:
+        return self._codec.decode(self._map.get_unsafe(key))
+
+    def _set_unsafe(self, key: _K, value: Any) -> None:
+        self._map.set_unsafe(key, self._codec.encode(value))
+    
+    def remove(self, key: _K, default: Any = None) -> Any:
+        self.phase_validator()
+        value = self._map.pop(key, default)
+        try:
+            return self._codec.decode(value)
+        finally:
+            release(value)
+    
+    def _value_with_returns_with_default(self, key: _K, default: Any, typ: type[_T]) -> tuple[_T, bool]:
+        self.phase_validator()
+        value = self._read(key)
+        if value is not _NO_DEFAULT:
+            return value, False
+        if type(default) is typ or isinstance(default, typ):
+            return default, True
+        if default is _NO_DEFAULT:
+            raise KeyError
+        return default, False
+    
+    def __str__(self):
+        self.phase_validator()
+        return str({key: self._codec.decode(value) for key, value in self._map.copy().items()})
+
+
+_UNFETCHED = object()
+
+class _SharedBatch(_Batch):
+    """Batch over the manager map that sends its writes in one call.
+
+    Keys read or written inside the block are kept in a local overlay, so
+    each key costs at most one round trip, and the encoded writes go to the
+    manager in a single update_unsafe() call on exit.
+    The overlay is only touched by the holder of the map lock, so one
+    instance per registry is still enough.
+    """
+    __slots__ = ("_values", "_writes")
+    def __init__(self, registry: SharedMessageRegistry, qualify: Callable[[Any], Any]):
+        super().__init__(registry, qualify)
+        self._values: dict[Any, Any] = {}
+        self._writes: dict[Any, Any] = {}
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # Writes made before an exception are kept, as with a local batch.
+        registry = self._registry
+        try:
+            if self._writes:
+                registry._map.update_unsafe(self._writes)
+        finally:
+            self._values.clear()
+            self._writes.clear()
+            if __debug__:
+                registry._batch_owner = None
+            registry._lock.__exit__(exc_type, exc, tb)
+    
+    def _get(self, qualified: Any) -> Any:
+        value = self._values.get(qualified, _UNFETCHED)
+        if value is _UNFETCHED:
+            value = self._registry._get_unsafe(qualified)
+            self._values[qualified] = value
+        return value
+
+    def exists_key(self, key: Any) -> bool:
+        qualified = self._qualify(key)
+        value = self._values.get(qualified, _UNFETCHED)
+        if value is _UNFETCHED:
+            # Asks for the version only, so the value is not sent
+            return self._registry._map.get_version_unsafe(qualified) != 0
+        return value is not _NO_DEFAULT
+    
+    def get_value(self, key: Any, typ: type[_T]) -> _T:
+        value = self._get(self._qualify(key))
+        if value is _NO_DEFAULT:
+            raise KeyError
+        if type(value) is not typ and not isinstance(value, typ):
+            raise TypeError
+        return value
+    
+    def set_value(self, key: Any, value: Any) -> None:
+        qualified = self._qualify(key)
+        if self._get(qualified) is _NO_DEFAULT:
+            raise KeyError
+        # Encoded now so that unpicklable values fail at the call site
+        self._writes[qualified] = self._registry._codec.encode(value)
+        self._values[qualified] = value
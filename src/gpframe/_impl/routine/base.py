@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 
 from typing import Any, Callable, Coroutine
 
-from gpframe._impl.routine.result import _NO_VALUE
+from gpframe._impl.common import _NO_VALUE
 
 SyncRoutineResultWaitFn = Callable[
     [float | None],
@@ -27,11 +27,13 @@ class RoutineExecution(ABC):
         ...
 
 class IntraProcessRoutineExecution(RoutineExecution):
+    __slots__ = ()
     @abstractmethod
     def request_stop_routine(self):
         ...
 
 class IPCRoutineExecution(RoutineExecution):
+    __slots__ = ()
     @abstractmethod
     def request_stop_routine(self, kill: bool):
         ...
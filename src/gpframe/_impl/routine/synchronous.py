@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+from threading import Lock
+from typing import Any, Callable
+
+from gpframe.contracts.exceptions import RoutineTaskTimeoutError
+
+from gpframe._impl.frame.worker import submit_frame_worker
+
+from gpframe._impl.routine.base import (
+    _NO_VALUE,
+    IntraProcessRoutineExecution,
+    SyncRoutineResultWaitFn,
+    AsyncRoutineResultWaitFn
+)
+
+def _set_result(fut: asyncio.Future, result: tuple[Any, Exception | None]) -> None:
+    if not fut.done():
+        fut.set_result(result)
+
+def _set_exception(fut: asyncio.Future, exc: BaseException) -> None:
+    if not fut.done():
+        fut.set_exception(exc)
+
+class SyncRoutine(IntraProcessRoutineExecution):
+    __slots__ = ("_lock", "_routine", "_context", "_running")
+    def __init__(self, lock: Lock):
+        self._lock = lock
+        self._routine = None
+        self._context = None
+        # True while a call is running on a worker, including one that was
+        # left running detached after a timeout or cancel.
+        self._running = False
+    
+    def load_routine(self, routine, context) -> None:
+        with self._lock:
+            # A second call would run concurrently on the same context,
+            # whose local message assumes accesses never overlap.
+            if self._running:
+                raise RuntimeError("previous routine call is still running")
+            self._routine = routine
+            self._context = context
+    
+    async def wait_routine_result(self, timeout: float | None = None) -> tuple[Any | _NO_VALUE, Exception | None]:
+        # The routine runs on a pooled worker thread, so the frame's loop
+        # stays free while it blocks: cancel() takes effect and the timeout
+        # is applied. A routine that outlives its timeout keeps running
+        # detached; threads cannot be interrupted.
+        with self._lock:
+            routine = self._routine
+            context = self._context
+            if routine is None:
+                raise RuntimeError("routine is not loading")
+            self._running = True
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        try:
+            submit_frame_worker(self._create_work(loop, fut, routine, context))
+        except BaseException:
+            with self._lock:
+                self._running = False
+            raise
+        try:
+            return await asyncio.wait_for(fut, timeout)
+        except asyncio.TimeoutError as e:
+            raise RoutineTaskTimeoutError(fut, timeout if timeout is not None else -1.0) from e
+        finally:
+            with self._lock:
+                self._routine = None
+                self._context = None
+    
+    def _create_work(self, loop: asyncio.AbstractEventLoop, fut: asyncio.Future, routine, context) -> Callable[[], None]:
+        def work():
+            # BaseException is caught too: it would otherwise end the pooled
+            # worker and leave fut unresolved, hanging the frame without a
+            # timeout.
+            try:
+                deliver, outcome = _set_result, (routine(context), None)
+            except Exception as e:
+                deliver, outcome = _set_result, (_NO_VALUE, e)
+            except BaseException as e:
+                deliver, outcome = _set_exception, e
+            finally:
+                with self._lock:
+                    self._running = False
+            try:
+                loop.call_soon_threadsafe(deliver, fut, outcome)
+            except RuntimeError:
+                # The frame has already ended (timed out or cancelled)
+                # and closed its loop.
+                pass
+        return work
+    
+    def get_wait_routine_result_fn(self) -> SyncRoutineResultWaitFn | AsyncRoutineResultWaitFn:
+        return self.wait_routine_result
+    
+    def routine_is_running(self) -> bool:
+        with self._lock:
+            return self._routine is not None or self._running
+    
+    def request_stop_routine(self, timeout: float | None = None, **kwargs) -> None:
+        return
+    
+    def cleanup(self, timeout: float | None = None) -> None:
+        pass
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from typing import Any, Mapping
+
+
+class GpFrameBaseError(Exception):
+    """フレームワーク由来例外のベースクラス  
+
+    このクラスおよびその派生クラスは、通常フレームワーク内部で生成される。  
+    """
+    __slots__ = ()
+
+
+class FrameStateError(GpFrameBaseError):
+    """Frameの生成やハンドリングに由来する例外のベースクラス"""
+    __slots__ = ()
+
+
+class MissingNameError(FrameStateError):
+    """有効なフレーム名が存在しない場合にスローされる"""
+    __slots__ = ()
+
+
+class FrameAggregateError(FrameStateError):
+    """フレームが終了した時点で解消されていない失敗をまとめて送出する  
+
+    circuit_errorはフレーム自身の例外、failed_framesは失敗したサブフレーム名と例外の対応。  
+    メッセージは文字列化された時点で初めて組み立てられる。
+    """
+    __slots__ = ("frame_name", "circuit_error", "failed_frames")
+
+    def __init__(
+            self,
+            frame_name: str,
+            circuit_error: BaseException | None,
+            failed_frames: Mapping[str, BaseException]
+        ):
+        self.frame_name = frame_name
+        self.circuit_error = circuit_error
+        self.failed_frames = failed_frames
+        self.__cause__ = circuit_error
+
+    def __str__(self) -> str:
+        lines = [f"frame '{self.frame_name}' ended with errors:"]
+        if self.circuit_error is not None:
+            lines.append(f"  {self.frame_name}: {self.circuit_error!r}")
+        for name, exc in self.failed_frames.items():
+            lines.append(f"  {name}: {exc!r}")
+        return "\n".join(lines)
+
+
+class RoutineTaskTimeoutError(GpFrameBaseError, TimeoutError):
+    """Routineが指定時間内に完了しなかった場合にスローされる  
+
+    taskは完了しなかったTaskまたはFuture。timeoutが指定されていない場合は-1.0。
+    """
+    __slots__ = ("task", "timeout")
+
+    def __init__(self, task: Any, timeout: float):
+        # OSError.__new__() leaves args empty for subclasses with their own
+        # __init__; set it so that pickling can rebuild the error.
+        self.args = (task, timeout)
+        self.task = task
+        self.timeout = timeout
+
+    def __str__(self) -> str:
+        return f"routine did not finish within {self.timeout} seconds"
+
+
+class RoutineSubprocessTimeoutError(GpFrameBaseError, TimeoutError):
+    """サブプロセスで実行中のRoutineが指定時間内に完了しなかった場合にスローされる  
+
+    processは実行中のまま残されたプロセス。
+    """
+    __slots__ = ("process", "timeout")
+
+    def __init__(self, process: Any, timeout: float):
+        # OSError.__new__() leaves args empty for subclasses with their own
+        # __init__; set it so that pickling can rebuild the error.
+        self.args = (process, timeout)
+        self.process = process
+        self.timeout = timeout
+
+    def __str__(self) -> str:
+        return f"routine subprocess (pid {self.process.pid}) did not finish within {self.timeout} seconds"
+
+
+class UncheckedError(GpFrameBaseError):
+    """フレームの未チェック例外をラップする  
+
+    生成時にはメッセージの整形を行わない。  
+    文字列化されるまでフレーム名と例外を保持するだけである。
+    """
+    __slots__ = ("frame_name", "cause")
+
+    def __init__(self, frame_name: str, cause: BaseException):
+        # BaseException.__new__() has already stored (frame_name, cause) in
+        # self.args, which keeps pickling intact; skip super().__init__() so
+        # nothing is formatted here.
+        self.frame_name = frame_name
+        self.cause = cause
+        self.__cause__ = cause
+
+    def __str__(self) -> str:
+        return f"unchecked error in frame '{self.frame_name}': {self.cause!r}"
+
+
+class CollectedError(GpFrameBaseError):
+    """複数フレームの未チェック例外をまとめてラップする  
+
+    集約メッセージは文字列化された時点で初めて組み立てられる。
+    """
+    __slots__ = ("errors",)
+
+    def __init__(self, errors: Mapping[str, BaseException]):
+        self.errors = errors
+
+    def __str__(self) -> str:
+        lines = [f"{len(self.errors)} unchecked error(s) in frames:"]
+        for name, exc in self.errors.items():
+            lines.append(f"  {name}: {exc!r}")
+        return "\n".join(lines)
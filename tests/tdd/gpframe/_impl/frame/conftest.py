@@ -0,0 +1,12 @@
+import pytest
+
+from gpframe._impl.frame.future import RootFrameExecutorImpl
+
+@pytest.fixture
+def root() -> RootFrameExecutorImpl:
+    # Root circuit ended with two sub-frames still running
+    root = RootFrameExecutorImpl(frame_name = "root")
+    root._on_start_sub_frame()
+    root._on_start_sub_frame()
+    root._end(None)
+    return root
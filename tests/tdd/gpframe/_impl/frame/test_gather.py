@@ -0,0 +1,84 @@
+from collections import deque
+import threading
+
+import pytest
+
+from gpframe._impl.frame.future import RootFrameExecutorImpl
+
+class _RacedDeque(deque):
+    # The first popleft() finds the entry already taken by a concurrent
+    # gather(), between the emptiness check and the pop.
+    def __init__(self):
+        super().__init__()
+        self.stolen = []
+    
+    def popleft(self):
+        if not self.stolen:
+            self.stolen.append(super().popleft())
+        return super().popleft()
+
+def test_gather_returns_ended_frames_in_end_order_once(root):
+    root._on_end_sub_frame("b", None)
+    root._on_end_sub_frame("a", ValueError())
+    assert root.gather() == ["b", "a"]
+    assert root.gather() == []
+
+def test_gather_one_waits_for_a_sub_frame_to_end(root):
+    threading.Timer(0.05, root._on_end_sub_frame, ("a", None)).start()
+    assert root.gather_one(timeout = 5.0) == "a"
+
+def test_gather_one_returns_an_already_ended_frame(root):
+    root._on_end_sub_frame("a", None)
+    assert root.gather_one(timeout = 0.0) == "a"
+    assert root.gather() == []
+
+def test_gather_one_raises_timeout_error(root):
+    with pytest.raises(TimeoutError):
+        root.gather_one(timeout = 0.05)
+
+def test_gather_one_waits_again_when_gather_took_the_frame(root):
+    ended_frames = _RacedDeque()
+    root.ended_frames = ended_frames
+    root._on_end_sub_frame("a", None)
+    threading.Timer(0.05, root._on_end_sub_frame, ("b", None)).start()
+    assert root.gather_one(timeout = 5.0) == "b"
+    assert ended_frames.stolen == ["a"]
+
+def test_gather_one_racing_gather_collects_each_frame_once():
+    count = 2000
+    root = RootFrameExecutorImpl(frame_name = "root")
+    for _ in range(count):
+        root._on_start_sub_frame()
+    root._end(None)
+    gathered: list[str] = []
+    errors: list[BaseException] = []
+    stop = threading.Event()
+    
+    def gather_one():
+        try:
+            while not stop.is_set():
+                try:
+                    gathered.append(root.gather_one(timeout = 0.01))
+                except TimeoutError:
+                    pass
+        except BaseException as e:
+            errors.append(e)
+    
+    def gather():
+        while not stop.is_set():
+            gathered.extend(root.gather())
+    
+    threads = [threading.Thread(target = gather_one) for _ in range(2)]
+    threads.append(threading.Thread(target = gather))
+    for t in threads:
+        t.start()
+    for i in range(count):
+        root._on_end_sub_frame(str(i), None)
+    root.frames_are_ended.wait(5.0)
+    while root.ended_frames:
+        pass
+    stop.set()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert sorted(gathered, key = int) == [str(i) for i in range(count)]
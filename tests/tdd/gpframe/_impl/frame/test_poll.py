@@ -0,0 +1,26 @@
+import pytest
+
+from gpframe._impl.frame.future import SubFrameError
+
+def test_poll_returns_ended_frames_and_new_failures(root):
+    error = ValueError()
+    root._on_end_sub_frame("a", None)
+    root._on_end_sub_frame("b", error)
+    assert root.poll() == (["a", "b"], {"b": error})
+
+def test_poll_consumes_what_it_returns(root):
+    root._on_end_sub_frame("a", ValueError())
+    root.poll()
+    assert root.poll() == ([], {})
+    assert root.gather() == []
+    root.raise_if()
+    assert root.failed_frames == {}
+
+def test_poll_skips_failures_already_raised(root):
+    root._on_end_sub_frame("a", ValueError())
+    with pytest.raises(SubFrameError):
+        root.raise_if()
+    assert root.poll() == (["a"], {})
+
+def test_poll_returns_nothing_while_frames_run(root):
+    assert root.poll() == ([], {})
@@ -0,0 +1,50 @@
+import pytest
+
+from gpframe._impl.frame.future import RootFrameExecutorImpl, SubFrameError
+from gpframe.contracts.exceptions import FrameAggregateError
+
+def test_raise_if_raises_each_failure_once(root):
+    error = ValueError()
+    root._on_end_sub_frame("a", error)
+    with pytest.raises(SubFrameError) as info:
+        root.raise_if()
+    assert info.value.frame_name == "a"
+    assert info.value.cause is error
+    root.raise_if()
+
+def test_raise_if_does_nothing_without_failures(root):
+    root._on_end_sub_frame("a", None)
+    root.raise_if()
+
+def test_raised_failure_is_not_raised_again_by_wait_done(root):
+    root._on_end_sub_frame("a", ValueError())
+    root._on_end_sub_frame("b", None)
+    with pytest.raises(SubFrameError):
+        root.raise_if()
+    assert root.drain() == {}
+    root.wait_done(timeout = 0.0)
+
+def test_wait_done_raises_unreported_failures(root):
+    error = ValueError()
+    root._on_end_sub_frame("a", error)
+    root._on_end_sub_frame("b", None)
+    with pytest.raises(FrameAggregateError) as info:
+        root.wait_done(timeout = 0.0)
+    assert info.value.failed_frames == {"a": error}
+    assert info.value.circuit_error is None
+
+def test_wait_done_raises_root_circuit_error():
+    root = RootFrameExecutorImpl(frame_name = "root")
+    error = ValueError()
+    root._end(error)
+    with pytest.raises(FrameAggregateError) as info:
+        root.wait_done(timeout = 0.0)
+    assert info.value.circuit_error is error
+    assert info.value.__cause__ is error
+
+def test_drain_consumes_unreported_failures(root):
+    error = ValueError()
+    root._on_end_sub_frame("a", error)
+    assert root.drain() == {"a": error}
+    root.raise_if()
+    assert root.drain() == {}
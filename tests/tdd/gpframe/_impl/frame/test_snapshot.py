@@ -0,0 +1,33 @@
+def test_snapshot_partitions_finished_frames_in_end_order(root):
+    error = ValueError()
+    root._on_end_sub_frame("b", error)
+    root._on_end_sub_frame("a", None)
+    assert root.snapshot() == (["b", "a"], ["a"], {"b": error})
+
+def test_snapshot_is_not_consumed_by_reporting(root):
+    error = ValueError()
+    root._on_end_sub_frame("a", error)
+    root.poll()
+    root.drain()
+    assert root.snapshot() == (["a"], [], {"a": error})
+
+def test_snapshot_is_empty_while_frames_run(root):
+    assert root.snapshot() == ([], [], {})
+
+def test_iter_methods_match_snapshot(root):
+    error = ValueError()
+    root._on_end_sub_frame("b", error)
+    root._on_end_sub_frame("a", None)
+    finished, successful, broken = root.snapshot()
+    assert list(root.iter_finished_frames()) == finished
+    assert list(root.iter_successful_frames()) == successful
+    assert list(root.iter_broken_frames()) == list(broken.items())
+
+def test_iter_methods_capture_state_when_called(root):
+    finished = root.iter_finished_frames()
+    successful = root.iter_successful_frames()
+    broken = root.iter_broken_frames()
+    root._on_end_sub_frame("a", ValueError())
+    assert list(finished) == []
+    assert list(successful) == []
+    assert list(broken) == []
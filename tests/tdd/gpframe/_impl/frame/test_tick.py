@@ -0,0 +1,39 @@
+import threading
+import time
+
+import pytest
+
+from gpframe._impl.frame.future import RootFrameExecutorImpl, _tick_wait
+
+def test_tick_wakes_on_a_state_change_before_the_interval(root):
+    threading.Timer(0.05, root._on_end_sub_frame, ("a", None)).start()
+    threading.Timer(0.1, root._on_end_sub_frame, ("b", None)).start()
+    start = time.monotonic()
+    ticks = sum(1 for _ in root.tick(5.0))
+    assert time.monotonic() - start < 2.0
+    assert ticks == 2
+
+def test_tick_yields_every_interval_while_running(root):
+    ticks = root.tick(0.01)
+    next(ticks)
+    next(ticks)
+    root._on_end_sub_frame("a", None)
+    root._on_end_sub_frame("b", None)
+    assert list(ticks) == []
+
+def test_tick_ends_at_once_when_frames_have_ended():
+    root = RootFrameExecutorImpl(frame_name = "root")
+    root._end(None)
+    assert list(root.tick(5.0)) == []
+
+def test_tick_raises_timeout_error_after_timeout(root):
+    with pytest.raises(TimeoutError):
+        for _ in root.tick(0.01, timeout = 0.05):
+            pass
+
+def test_tick_wait_is_capped_by_the_deadline():
+    assert _tick_wait(1.0, None) == 1.0
+    assert _tick_wait(1.0, time.monotonic() + 10) == 1.0
+    assert _tick_wait(1.0, time.monotonic() + 0.5) <= 0.5
+    with pytest.raises(TimeoutError):
+        _tick_wait(1.0, time.monotonic() - 1)
@@ -0,0 +1,32 @@
+import threading
+
+import pytest
+
+def test_wait_broken_frame_returns_the_failed_frame(root):
+    threading.Timer(0.05, root._on_end_sub_frame, ("a", None)).start()
+    threading.Timer(0.1, root._on_end_sub_frame, ("b", ValueError())).start()
+    assert root.wait_broken_frame(timeout = 5.0) == "b"
+
+def test_wait_broken_frame_consumes_the_failure(root):
+    error = ValueError()
+    root._on_end_sub_frame("a", error)
+    assert root.wait_broken_frame(timeout = 0.0) == "a"
+    root.raise_if()
+    assert root.poll() == (["a"], {})
+    assert root.snapshot()[2] == {"a": error}
+
+def test_wait_broken_frame_returns_none_when_frames_end_cleanly(root):
+    root._on_end_sub_frame("a", None)
+    root._on_end_sub_frame("b", None)
+    assert root.wait_broken_frame(timeout = 0.0) is None
+
+def test_wait_broken_frame_skips_drained_failures(root):
+    root._on_end_sub_frame("a", ValueError())
+    root.drain()
+    root._on_end_sub_frame("b", None)
+    assert root.wait_broken_frame(timeout = 0.0) is None
+
+def test_wait_broken_frame_raises_timeout_error(root):
+    root._on_end_sub_frame("a", None)
+    with pytest.raises(TimeoutError):
+        root.wait_broken_frame(timeout = 0.05)
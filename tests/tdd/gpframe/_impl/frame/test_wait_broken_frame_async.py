@@ -0,0 +1,31 @@
+import asyncio
+import threading
+
+import pytest
+
+def test_wait_broken_frame_async_waits_past_clean_ends(root):
+    async def main():
+        threading.Timer(0.05, root._on_end_sub_frame, ("a", None)).start()
+        threading.Timer(0.1, root._on_end_sub_frame, ("b", ValueError())).start()
+        return await root.wait_broken_frame_async(timeout = 5.0)
+    assert asyncio.run(main()) == "b"
+    assert root.poll() == (["a", "b"], {})
+
+def test_wait_broken_frame_async_returns_none_when_frames_end_cleanly(root):
+    async def main():
+        threading.Timer(0.05, root._on_end_sub_frame, ("a", None)).start()
+        threading.Timer(0.1, root._on_end_sub_frame, ("b", None)).start()
+        return await root.wait_broken_frame_async(timeout = 5.0)
+    assert asyncio.run(main()) is None
+
+def test_wait_broken_frame_async_returns_a_pending_failure_at_once(root):
+    root._on_end_sub_frame("a", ValueError())
+    assert asyncio.run(root.wait_broken_frame_async(timeout = 0.0)) == "a"
+
+def test_wait_broken_frame_async_raises_timeout_error(root):
+    async def main():
+        threading.Timer(0.02, root._on_end_sub_frame, ("a", None)).start()
+        await root.wait_broken_frame_async(timeout = 0.1)
+    with pytest.raises(TimeoutError):
+        asyncio.run(main())
+    assert not root.state_waiters._waiters
@@ -0,0 +1,59 @@
+import asyncio
+import threading
+
+import pytest
+
+from gpframe._impl.frame.future import SubFrameExecutorImpl, _LoopWaiters
+from gpframe.contracts.exceptions import FrameAggregateError
+
+def test_wait_done_async_returns_when_frames_end(root):
+    async def main():
+        threading.Timer(0.05, root._on_end_sub_frame, ("a", None)).start()
+        threading.Timer(0.1, root._on_end_sub_frame, ("b", None)).start()
+        await root.wait_done_async(timeout = 5.0)
+    asyncio.run(main())
+    assert not root.processing()
+    assert not root.loop_waiters._waiters
+
+def test_wait_done_async_raises_timeout_error(root):
+    with pytest.raises(TimeoutError):
+        asyncio.run(root.wait_done_async(timeout = 0.05))
+    assert not root.loop_waiters._waiters
+
+def test_wait_done_async_raises_unreported_failures(root):
+    error = ValueError()
+    root._on_end_sub_frame("a", error)
+    root._on_end_sub_frame("b", None)
+    with pytest.raises(FrameAggregateError) as info:
+        asyncio.run(root.wait_done_async(timeout = 5.0))
+    assert info.value.failed_frames == {"a": error}
+
+def test_sub_frame_wait_done_async_returns_when_circuit_ends(root):
+    sub = SubFrameExecutorImpl(frame_name = "a", root = root)
+    async def main():
+        threading.Timer(0.05, sub._end, (None,)).start()
+        await sub.wait_done_async(timeout = 5.0)
+    asyncio.run(main())
+    assert root.gather() == ["a"]
+
+def test_loop_waiters_wake_every_waiter():
+    lock = threading.Lock()
+    waiters = _LoopWaiters()
+    ready = False
+    def set_ready():
+        nonlocal ready
+        with lock:
+            ready = True
+            waiters.notify_unsafe()
+    async def main():
+        threading.Timer(0.05, set_ready).start()
+        await asyncio.gather(*(waiters.wait(lock, lambda: ready, 5.0) for _ in range(3)))
+    asyncio.run(main())
+    assert waiters._waiters == []
+
+def test_loop_waiters_return_at_once_when_ready():
+    async def main():
+        waiters = _LoopWaiters()
+        await waiters.wait(threading.Lock(), lambda: True, 0.0)
+        assert waiters._waiters == []
+    asyncio.run(main())
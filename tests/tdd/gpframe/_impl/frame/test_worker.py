@@ -0,0 +1,31 @@
+import logging
+import queue
+import threading
+import time
+
+from gpframe._impl.frame.worker import FrameThreadPool
+
+def test_worker_survives_an_exception_and_logs_it(caplog):
+    pool = FrameThreadPool(idle_timeout = 5.0)
+    threads: queue.SimpleQueue = queue.SimpleQueue()
+    def fail():
+        threads.put(threading.current_thread())
+        raise ValueError("boom")
+    with caplog.at_level(logging.ERROR):
+        pool.submit(fail)
+        first = threads.get(timeout = 5.0)
+        # The failed worker parks again and is handed the next job
+        while not pool._idle:
+            time.sleep(0.01)
+        pool.submit(lambda: threads.put(threading.current_thread()))
+        assert threads.get(timeout = 5.0) is first
+    assert "unhandled error in frame worker" in caplog.text
+
+def test_idle_worker_exits_after_idle_timeout():
+    pool = FrameThreadPool(idle_timeout = 0.05)
+    threads: queue.SimpleQueue = queue.SimpleQueue()
+    pool.submit(lambda: threads.put(threading.current_thread()))
+    thread = threads.get(timeout = 5.0)
+    thread.join(5.0)
+    assert not thread.is_alive()
+    assert pool._idle == []
@@ -0,0 +1,10 @@
+import pytest
+
+from gpframe._impl.message.shared import MessageSyncManager
+
+@pytest.fixture(scope = "module")
+def manager():
+    manager = MessageSyncManager()
+    manager.start()
+    yield manager
+    manager.shutdown()
@@ -0,0 +1,85 @@
+import pickle
+from multiprocessing import shared_memory
+
+import pytest
+
+from gpframe._impl.message.codec import (
+    DEFAULT_CODEC,
+    Packed,
+    ShmPacked,
+    SharedMemoryCodec,
+    StaleValueError,
+    _SHM_AVAILABLE,
+    decode,
+    encode,
+    release,
+)
+from gpframe._impl.message.shared import SharedMessageRegistry
+
+needs_shm = pytest.mark.skipif(not _SHM_AVAILABLE, reason = "shared memory values are disabled on this platform")
+
+def _exists(name: str) -> bool:
+    try:
+        shm = shared_memory.SharedMemory(name)
+    except FileNotFoundError:
+        return False
+    shm.close()
+    return True
+
+def _value_name(registry: SharedMessageRegistry, key: str) -> str:
+    encoded = registry._map.get(key)
+    assert type(encoded) is ShmPacked
+    return encoded.name
+
+def test_scalars_and_short_plain_tuples_are_not_wrapped():
+    for value in (1, 1.5, "s", b"b", True, None, (1, "a")):
+        assert encode(value) is value
+        assert decode(value) is value
+
+def test_other_values_are_pickled_once():
+    encoded = encode([1, {"a": 2}])
+    assert type(encoded) is Packed
+    assert decode(pickle.loads(pickle.dumps(encoded))) == [1, {"a": 2}]
+
+def test_small_values_stay_in_band():
+    codec = SharedMemoryCodec(threshold = 1024)
+    assert type(codec.encode(bytearray(10))) is Packed
+
+@needs_shm
+def test_large_buffers_go_through_shared_memory():
+    codec = SharedMemoryCodec(threshold = 1024)
+    value = bytearray(range(256)) * 8
+    encoded = codec.encode(value)
+    assert type(encoded) is ShmPacked
+    try:
+        assert codec.decode(encoded) == value
+    finally:
+        release(encoded)
+
+@needs_shm
+def test_release_unlinks_the_block_and_later_decodes_are_stale():
+    encoded = SharedMemoryCodec(threshold = 1).encode(bytearray(16))
+    assert _exists(encoded.name)
+    release(encoded)
+    assert not _exists(encoded.name)
+    with pytest.raises(StaleValueError):
+        decode(encoded)
+    # Releasing twice is harmless
+    release(encoded)
+
+@needs_shm
+def test_replaced_values_are_freed_by_the_map(manager):
+    registry = SharedMessageRegistry(manager.SharedMessageMap(), codec = SharedMemoryCodec(threshold = 1))
+    registry.update("a", bytearray(16))
+    name = _value_name(registry, "a")
+    assert registry.get("a", bytearray) == bytearray(16)
+    registry.update("a", bytearray(32))
+    assert not _exists(name)
+    name = _value_name(registry, "a")
+    registry._map.clear()
+    assert not _exists(name)
+
+def test_default_codec_round_trips_through_the_registry(manager):
+    registry = SharedMessageRegistry(manager.SharedMessageMap(), codec = DEFAULT_CODEC)
+    registry.update("a", {"k": [1, 2]})
+    assert registry.get("a", dict) == {"k": [1, 2]}
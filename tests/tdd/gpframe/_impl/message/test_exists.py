@@ -0,0 +1,52 @@
+import pytest
+
+from gpframe._impl.message.lock import StripedLock
+from gpframe._impl.message.message import MessageRegistry
+from gpframe._impl.message.shared import SharedMessageMap, SharedMessageRegistry
+
+class CountingMap(SharedMessageMap):
+    def __init__(self):
+        super().__init__()
+        self.value_requests = 0
+    
+    def get_if_changed(self, key, version):
+        self.value_requests += 1
+        return super().get_if_changed(key, version)
+
+    def get_unsafe(self, key, default = None):
+        self.value_requests += 1
+        return super().get_unsafe(key, default)
+
+@pytest.mark.parametrize("combine_writes", [False, True])
+def test_exists(combine_writes):
+    registry = MessageRegistry(StripedLock(4), {}, combine_writes = combine_writes)
+    assert not registry.exists("a")
+    registry.update("a", None)
+    assert registry.exists("a")
+
+def test_shared_exists_asks_for_the_version_only():
+    map_ = CountingMap()
+    registry = SharedMessageRegistry(map_)
+    assert not registry.exists("a")
+    registry.update("a", [1])
+    assert registry.exists("a")
+    registry.remove("a")
+    assert not registry.exists("a")
+    assert map_.value_requests == 0
+
+def test_shared_exists_after_a_read_needs_no_request():
+    map_ = CountingMap()
+    registry = SharedMessageRegistry(map_)
+    registry.update("a", 1)
+    registry.get("a", int)
+    assert registry.exists("a")
+    assert map_.value_requests == 1
+
+def test_shared_batch_exists_key_asks_for_the_version_only():
+    map_ = CountingMap()
+    registry = SharedMessageRegistry(map_)
+    registry.update("a", 1)
+    with registry.batch() as batch:
+        assert batch.exists_key("a")
+        assert not batch.exists_key("b")
+    assert map_.value_requests == 0
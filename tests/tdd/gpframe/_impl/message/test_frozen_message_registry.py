@@ -0,0 +1,30 @@
+import pickle
+
+import pytest
+
+from gpframe._impl.message.message import FrozenMessageRegistry
+
+def test_reads_go_straight_to_the_map():
+    registry = FrozenMessageRegistry({"a": 1, "s": " 2 "})
+    assert registry.get("a", int) == 1
+    assert registry.getd("missing", int, 5) == 5
+    assert registry.geta("missing", None) is None
+    assert registry.string_to_int("s", prep = str.strip) == 2
+    with pytest.raises(KeyError):
+        registry.geta("missing")
+    with pytest.raises(TypeError):
+        registry.get("a", str)
+
+def test_reader_facade_forwards():
+    registry = FrozenMessageRegistry({"a": 1})
+    assert registry.reader.get("a", int) == 1
+    assert registry.reader.exists("a")
+
+def test_map_is_pickled_once():
+    registry = FrozenMessageRegistry({"a": [1]})
+    first = pickle.dumps(registry)
+    registry._map["b"] = 2 # never happens after loading; shows the bytes are reused
+    copy = pickle.loads(pickle.dumps(registry))
+    assert pickle.loads(first).get("a", list) == [1]
+    assert not copy.exists("b")
+    assert copy.get("a", list) == [1]
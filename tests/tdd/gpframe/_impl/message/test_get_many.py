@@ -0,0 +1,63 @@
+import threading
+
+import pytest
+
+from gpframe._impl.message.lock import StripedLock
+from gpframe._impl.message.message import FrozenMessageRegistry, MessageRegistry
+from gpframe._impl.message.reflector import MessageReflector
+from gpframe._impl.message.shared import SharedMessageMap, SharedMessageRegistry
+
+VALUES = {"a": 1, "b": "x", "c": [1]}
+
+@pytest.fixture(params = ["lock", "striped", "frozen", "shared"])
+def registry(request):
+    if request.param == "frozen":
+        return FrozenMessageRegistry(dict(VALUES))
+    if request.param == "lock":
+        registry = MessageRegistry(threading.Lock(), {})
+    elif request.param == "striped":
+        registry = MessageRegistry(StripedLock(4), {}, combine_writes = True)
+    else:
+        registry = SharedMessageRegistry(SharedMessageMap())
+    for key, value in VALUES.items():
+        registry.update(key, value)
+    return registry
+
+def test_values_come_back_in_request_order(registry):
+    assert registry.get_many((("c", list), ("a", int), ("b", str))) == ([1], 1, "x")
+
+def test_missing_key_raises_key_error(registry):
+    with pytest.raises(KeyError):
+        registry.get_many((("a", int), ("missing", int)))
+
+def test_mismatched_type_raises_type_error(registry):
+    with pytest.raises(TypeError):
+        registry.get_many((("a", int), ("b", int)))
+
+def test_subclass_instances_match(registry):
+    assert registry.get_many((("a", object),)) == (1,)
+
+def test_reader_facade_forwards(registry):
+    assert registry.reader.get_many((("a", int),)) == (1,)
+
+def test_reflector_qualifies_every_key():
+    registry = MessageRegistry(threading.Lock(), {})
+    reflector = MessageReflector("ns", registry)
+    reflector.updater.update("a", 1)
+    reflector.updater.update("b", 2)
+    assert reflector.reader.get_many((("a", int), ("b", int))) == (1, 2)
+    assert not registry.exists("a")
+
+def test_shared_reads_are_served_from_one_round_trip():
+    calls = []
+    class CountingMap(SharedMessageMap):
+        def get_many_if_changed(self, requests):
+            calls.append(requests)
+            return super().get_many_if_changed(requests)
+        def get_if_changed(self, key, version):
+            raise AssertionError("single-key request")
+    registry = SharedMessageRegistry(CountingMap())
+    registry.update("a", 1)
+    registry.update("b", 2)
+    assert registry.get_many((("a", int), ("b", int))) == (1, 2)
+    assert len(calls) == 1
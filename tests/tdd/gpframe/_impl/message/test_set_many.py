@@ -0,0 +1,78 @@
+import threading
+
+import pytest
+
+from gpframe._impl.message.codec import SharedMemoryCodec, ShmPacked, StaleValueError, _SHM_AVAILABLE, decode
+from gpframe._impl.message.lock import StripedLock
+from gpframe._impl.message.message import MessageRegistry
+from gpframe._impl.message.reflector import MessageReflector
+from gpframe._impl.message.shared import SharedMessageMap, SharedMessageRegistry
+
+@pytest.fixture(params = ["lock", "striped", "shared"])
+def registry(request):
+    if request.param == "lock":
+        registry = MessageRegistry(threading.Lock(), {})
+    elif request.param == "striped":
+        registry = MessageRegistry(StripedLock(4), {}, combine_writes = True)
+    else:
+        registry = SharedMessageRegistry(SharedMessageMap())
+    registry.update("a", 0)
+    registry.update("b", "")
+    return registry
+
+def test_every_value_is_written(registry):
+    registry.updater.set_many((("a", int, 1), ("b", str, "x")))
+    assert registry.get_many((("a", int), ("b", str))) == (1, "x")
+
+def test_last_value_wins_for_a_repeated_key(registry):
+    registry.set_many((("a", int, 1), ("a", int, 2)))
+    assert registry.get("a", int) == 2
+
+@pytest.mark.parametrize("items, error", [
+    ((("a", int, 1), ("missing", int, 1)), KeyError),
+    ((("a", int, 1), ("b", int, 1)), TypeError),
+    ((("a", int, 1), ("b", str, 1)), TypeError),
+])
+def test_nothing_is_written_if_an_item_fails(registry, items, error):
+    with pytest.raises(error):
+        registry.set_many(items)
+    assert registry.get_many((("a", int), ("b", str))) == (0, "")
+
+def test_reflector_qualifies_every_key():
+    registry = MessageRegistry(threading.Lock(), {})
+    reflector = MessageReflector("ns", registry)
+    reflector.updater.update("a", 0)
+    reflector.updater.set_many((("a", int, 1),))
+    assert reflector.reader.get("a", int) == 1
+
+def test_shared_writes_go_in_one_call():
+    calls = []
+    class CountingMap(SharedMessageMap):
+        def update(self, other):
+            calls.append(dict(other))
+            super().update(other)
+    registry = SharedMessageRegistry(CountingMap())
+    registry.update("a", 0)
+    registry.update("b", "")
+    registry.set_many((("a", int, 1), ("b", str, "x")))
+    assert calls == [{"a": 1, "b": "x"}]
+
+@pytest.mark.skipif(not _SHM_AVAILABLE, reason = "shared memory values are disabled on this platform")
+def test_shared_blocks_are_released_when_encoding_fails():
+    encoded = []
+    class RecordingCodec(SharedMemoryCodec):
+        def encode(self, value):
+            if value == "fail":
+                raise ValueError
+            result = super().encode(value)
+            encoded.append(result)
+            return result
+    registry = SharedMessageRegistry(SharedMessageMap(), codec = RecordingCodec(threshold = 1))
+    registry.update("a", bytearray(4))
+    registry.update("b", "")
+    encoded.clear()
+    with pytest.raises(ValueError):
+        registry.set_many((("a", bytearray, bytearray(8)), ("b", str, "fail")))
+    assert [type(value) for value in encoded] == [ShmPacked]
+    with pytest.raises(StaleValueError):
+        decode(encoded[0])
@@ -0,0 +1,81 @@
+import pickle
+
+import pytest
+
+from gpframe._impl.common import _NO_DEFAULT
+from gpframe._impl.message.shared import SharedMessageMap, SharedMessageRegistry
+
+def test_every_write_stamps_a_new_version():
+    map_ = SharedMessageMap()
+    assert map_.get_version("a") == 0
+    map_.set("a", 1)
+    first = map_.get_version("a")
+    map_.set("a", 2)
+    assert map_.get_version("a") > first
+
+def test_get_if_changed_sends_the_value_only_when_the_version_moved():
+    map_ = SharedMessageMap()
+    map_.set("a", 1)
+    version, changed, value = map_.get_if_changed("a", 0)
+    assert (changed, value) == (True, 1)
+    assert map_.get_if_changed("a", version) == (version, False, None)
+
+def test_missing_key_has_version_zero():
+    map_ = SharedMessageMap()
+    assert map_.get_if_changed("a", 0) == (0, False, None)
+    assert map_.get_if_changed("a", 3) == (0, True, _NO_DEFAULT)
+
+def test_get_many_if_changed_answers_each_pair():
+    map_ = SharedMessageMap()
+    map_.update({"a": 1, "b": 2})
+    version_a = map_.get_version("a")
+    replies = map_.get_many_if_changed([("a", version_a), ("b", 0), ("c", 0)])
+    assert replies[0] == (version_a, False, None)
+    assert replies[1][1:] == (True, 2)
+    assert replies[2] == (0, False, None)
+
+def test_pop_and_clear_drop_the_version():
+    map_ = SharedMessageMap()
+    map_.update({"a": 1, "b": 2})
+    assert map_.pop("a") == 1
+    assert map_.get_version("a") == 0
+    map_.clear()
+    assert map_.get_version("b") == 0
+    assert map_.copy() == {}
+
+def test_registry_over_the_manager_map(manager):
+    registry = SharedMessageRegistry(manager.SharedMessageMap())
+    registry.update("a", 1)
+    registry.update("b", [1, 2])
+    assert registry.get("a", int) == 1
+    assert registry.get("b", list) == [1, 2]
+    assert registry.apply("a", int, lambda v: v + 1) == 2
+    assert registry.geta("missing", None) is None
+    with pytest.raises(KeyError):
+        registry.get("missing", int)
+    with pytest.raises(TypeError):
+        registry.get("a", str)
+    assert registry.remove("b") == [1, 2]
+    assert not registry.exists("b")
+
+def test_reads_return_a_fresh_copy_of_mutable_values(manager):
+    registry = SharedMessageRegistry(manager.SharedMessageMap())
+    registry.update("a", [1])
+    registry.get("a", list).append(2)
+    assert registry.get("a", list) == [1]
+
+def test_batch_sends_its_writes_on_exit(manager):
+    registry = SharedMessageRegistry(manager.SharedMessageMap())
+    registry.update("a", 1)
+    with registry.batch() as batch:
+        batch.set_value("a", batch.get_value("a", int) + 1)
+        assert batch.exists_key("a")
+        assert not batch.exists_key("b")
+    assert registry.get("a", int) == 2
+
+def test_registry_pickles_with_its_map(manager):
+    registry = SharedMessageRegistry(manager.SharedMessageMap())
+    registry.update("a", 1)
+    copy = pickle.loads(pickle.dumps(registry))
+    copy.update("a", 2)
+    assert registry.get("a", int) == 2
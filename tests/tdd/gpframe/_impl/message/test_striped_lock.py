@@ -0,0 +1,20 @@
+import pytest
+
+from gpframe._impl.message.lock import StripedLock
+
+def test_number_of_stripes_must_be_a_power_of_two():
+    for n in (0, 3, 6):
+        with pytest.raises(ValueError):
+            StripedLock(n)
+    assert len(StripedLock(8).stripes) == 8
+
+def test_index_selects_a_stripe_by_hash():
+    lock = StripedLock(4)
+    for key in ("a", "b", 1, 2, 3):
+        assert lock.index(key) == hash(key) & 3
+
+def test_context_manager_takes_every_stripe():
+    lock = StripedLock(4)
+    with lock:
+        assert all(stripe.locked() for stripe in lock.stripes)
+    assert not any(stripe.locked() for stripe in lock.stripes)
@@ -0,0 +1,88 @@
+import threading
+
+import pytest
+
+from gpframe._impl.message.codec import SharedMemoryCodec, _SHM_AVAILABLE
+from gpframe._impl.message.lock import StripedLock
+from gpframe._impl.message.message import MessageRegistry
+from gpframe._impl.message.shared import SharedMessageMap, SharedMessageRegistry
+
+@pytest.fixture(params = ["lock", "striped", "shared"])
+def registry(request):
+    if request.param == "lock":
+        return MessageRegistry(threading.Lock(), {})
+    if request.param == "striped":
+        return MessageRegistry(StripedLock(4), {}, combine_writes = True)
+    return SharedMessageRegistry(SharedMessageMap())
+
+def test_swap_returns_the_old_value(registry):
+    registry.update("a", 1)
+    assert registry.swap("a", int, 2) == 1
+    assert registry.get("a", int) == 2
+
+def test_swap_on_a_missing_key_writes_nothing(registry):
+    with pytest.raises(KeyError):
+        registry.swap("a", int, 1)
+    assert not registry.exists("a")
+
+def test_swap_with_a_mismatched_type_writes_nothing(registry):
+    registry.update("a", 1)
+    with pytest.raises(TypeError):
+        registry.swap("a", int, "x")
+    with pytest.raises(TypeError):
+        registry.swap("a", str, "x")
+    assert registry.get("a", int) == 1
+
+
+class _InterleavedMap(SharedMessageMap):
+    # Lets another writer in right before the first compare-and-swap
+    def __init__(self):
+        super().__init__()
+        self.interleave = None
+
+    def swap_if_version(self, key, value, version):
+        if self.interleave is not None:
+            self.interleave(self)
+            self.interleave = None
+        return super().swap_if_version(key, value, version)
+
+def test_shared_swap_retries_when_another_write_came_in_between():
+    map_ = _InterleavedMap()
+    registry = SharedMessageRegistry(map_)
+    registry.update("a", 1)
+    map_.interleave = lambda m: m.set("a", 5)
+    assert registry.swap("a", int, 2) == 5
+    assert registry.get("a", int) == 2
+
+def test_shared_swap_does_not_write_when_the_key_was_removed_in_between():
+    map_ = _InterleavedMap()
+    registry = SharedMessageRegistry(map_)
+    registry.update("a", 1)
+    map_.interleave = lambda m: m.pop("a")
+    with pytest.raises(KeyError):
+        registry.swap("a", int, 2)
+    assert not registry.exists("a")
+
+
+class _ReplacingMap(SharedMessageMap):
+    # Replaces the value right after it was sent, releasing its block
+    def __init__(self):
+        super().__init__()
+        self.replacement = None
+
+    def get_if_changed(self, key, version):
+        reply = super().get_if_changed(key, version)
+        if self.replacement is not None:
+            self.set(key, self.replacement)
+            self.replacement = None
+        return reply
+
+@pytest.mark.skipif(not _SHM_AVAILABLE, reason = "shared memory values are disabled on this platform")
+def test_shared_swap_refetches_a_value_released_after_it_was_read():
+    codec = SharedMemoryCodec(threshold = 1)
+    map_ = _ReplacingMap()
+    registry = SharedMessageRegistry(map_, codec = codec)
+    registry.update("a", bytearray(8))
+    map_.replacement = codec.encode(bytearray(b"x" * 8))
+    assert registry.swap("a", bytearray, bytearray(4)) == bytearray(b"x" * 8)
+    assert registry.get("a", bytearray) == bytearray(4)
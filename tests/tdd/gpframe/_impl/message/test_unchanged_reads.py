@@ -0,0 +1,66 @@
+from struct import pack_into
+
+import pytest
+
+from gpframe._impl.message.codec import _SHM_AVAILABLE
+from gpframe._impl.message.shared import _MAP_CLOSED, SharedMessageMap, SharedMessageRegistry
+
+pytestmark = pytest.mark.skipif(not _SHM_AVAILABLE, reason = "the map version is not published on this platform")
+
+class CountingMap(SharedMessageMap):
+    def __init__(self):
+        super().__init__()
+        self.requests = 0
+
+    def get_if_changed(self, key, version):
+        self.requests += 1
+        return super().get_if_changed(key, version)
+
+def test_repeated_reads_of_an_unchanged_map_skip_the_request():
+    map_ = CountingMap()
+    registry = SharedMessageRegistry(map_)
+    registry.update("a", [1])
+    assert registry.get("a", list) == [1]
+    assert registry.get("a", list) == [1]
+    assert map_.requests == 1
+
+def test_any_write_makes_the_next_read_ask_again():
+    map_ = CountingMap()
+    registry = SharedMessageRegistry(map_)
+    registry.update("a", 1)
+    registry.get("a", int)
+    map_.set("b", 2)
+    assert registry.get("a", int) == 1
+    assert map_.requests == 2
+    map_.set("a", 3)
+    assert registry.get("a", int) == 3
+
+def test_a_closed_map_is_never_trusted():
+    map_ = CountingMap()
+    registry = SharedMessageRegistry(map_)
+    registry.update("a", 1)
+    registry.get("a", int)
+    pack_into("Q", map_._written.buf, 0, _MAP_CLOSED)
+    registry.get("a", int)
+    registry.get("a", int)
+    assert map_.requests == 3
+
+def test_closed_registry_asks_the_manager_every_time():
+    map_ = CountingMap()
+    registry = SharedMessageRegistry(map_)
+    registry.update("a", 1)
+    registry.get("a", int)
+    registry.close()
+    registry.get("a", int)
+    registry.get("a", int)
+    assert map_.requests == 3
+
+def test_readers_in_other_processes_see_writes(manager):
+    map_ = manager.SharedMessageMap()
+    writer = SharedMessageRegistry(map_)
+    reader = SharedMessageRegistry(map_)
+    writer.update("a", 1)
+    assert reader.get("a", int) == 1
+    writer.update("a", 2)
+    assert reader.get("a", int) == 2
+    reader.close()
@@ -0,0 +1,72 @@
+import threading
+
+from gpframe._impl.message.lock import StripedLock
+from gpframe._impl.message.message import MessageRegistry
+
+def _registry(n: int = 4) -> MessageRegistry:
+    return MessageRegistry(StripedLock(n), {}, combine_writes = True)
+
+def test_update_is_visible_to_the_next_read():
+    registry = _registry()
+    registry.update("a", 1)
+    assert registry.get("a", int) == 1
+    assert registry.exists("a")
+
+def test_update_on_a_held_stripe_is_queued_and_applied_by_the_next_holder():
+    registry = _registry()
+    stripe = registry._key_locks[hash("a") & registry._mask]
+    with stripe:
+        # Does not block on the held stripe
+        registry.update("a", 1)
+        assert "a" not in registry._map
+    assert registry.get("a", int) == 1
+
+def test_whole_map_operations_flush_every_stripe():
+    registry = _registry()
+    held = [registry._key_locks[hash(key) & registry._mask] for key in ("a", "b")]
+    for lock in set(held):
+        lock.acquire()
+    try:
+        registry.update("a", 1)
+        registry.update("b", 2)
+    finally:
+        for lock in set(held):
+            lock.release()
+    assert registry.get_many((("a", int), ("b", int))) == (1, 2)
+
+def test_queued_writes_keep_their_order():
+    registry = _registry()
+    stripe = registry._key_locks[hash("a") & registry._mask]
+    with stripe:
+        for i in range(5):
+            registry.update("a", i)
+    assert registry.get("a", int) == 4
+
+def test_batch_sees_queued_writes():
+    registry = _registry()
+    registry.update("a", 0)
+    stripe = registry._key_locks[hash("a") & registry._mask]
+    with stripe:
+        registry.update("a", 1)
+    with registry.batch() as batch:
+        assert batch.get_value("a", int) == 1
+
+def test_single_lock_maps_every_key_to_it():
+    registry = MessageRegistry(threading.Lock(), {}, combine_writes = True)
+    assert registry._mask == 0
+    for key in ("a", "b", 1):
+        registry.update(key, key)
+        assert registry.geta(key) == key
+
+def test_concurrent_updates_are_not_lost():
+    registry = _registry()
+    keys = [f"k{i}" for i in range(8)]
+    def writer(key):
+        for i in range(1000):
+            registry.update(key, i)
+    threads = [threading.Thread(target = writer, args = (key,)) for key in keys]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert registry.get_many(tuple((key, int) for key in keys)) == (999,) * len(keys)
@@ -0,0 +1,81 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from gpframe._impl.common import _NO_VALUE
+from gpframe._impl.routine.synchronous import SyncRoutine
+from gpframe.contracts.exceptions import RoutineTaskTimeoutError
+
+@pytest.fixture
+def routine() -> SyncRoutine:
+    return SyncRoutine(threading.Lock())
+
+def _run(routine: SyncRoutine, fn, context = None, timeout: float | None = 5.0):
+    routine.load_routine(fn, context)
+    return asyncio.run(routine.wait_routine_result(timeout))
+
+def test_result_is_delivered(routine):
+    assert _run(routine, lambda context: context * 2, 21) == (42, None)
+    assert not routine.routine_is_running()
+
+def test_routine_runs_off_the_frame_thread(routine):
+    caller = threading.get_ident()
+    ident, exc = _run(routine, lambda context: threading.get_ident())
+    assert exc is None
+    assert ident != caller
+
+def test_exception_is_returned_with_no_value(routine):
+    error = ValueError()
+    def fn(context):
+        raise error
+    assert _run(routine, fn) == (_NO_VALUE, error)
+    assert not routine.routine_is_running()
+
+def test_base_exception_is_propagated(routine):
+    class Stop(BaseException):
+        pass
+    def fn(context):
+        raise Stop
+    with pytest.raises(Stop):
+        _run(routine, fn)
+    assert not routine.routine_is_running()
+
+def test_timeout_raises_routine_task_timeout_error(routine):
+    release = threading.Event()
+    try:
+        with pytest.raises(RoutineTaskTimeoutError) as info:
+            _run(routine, lambda context: release.wait(5.0), timeout = 0.05)
+        assert info.value.timeout == 0.05
+    finally:
+        release.set()
+
+def test_load_routine_raises_while_a_timed_out_call_runs(routine):
+    release = threading.Event()
+    done = threading.Event()
+    def fn(context):
+        release.wait(5.0)
+        done.set()
+    try:
+        with pytest.raises(RoutineTaskTimeoutError):
+            _run(routine, fn, timeout = 0.05)
+        assert routine.routine_is_running()
+        with pytest.raises(RuntimeError):
+            routine.load_routine(fn, None)
+    finally:
+        release.set()
+    assert done.wait(5.0)
+    deadline = time.monotonic() + 5.0
+    while routine.routine_is_running() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert _run(routine, lambda context: 1) == (1, None)
+
+def test_routine_is_running_while_loaded(routine):
+    assert not routine.routine_is_running()
+    routine.load_routine(lambda context: None, None)
+    assert routine.routine_is_running()
+
+def test_wait_without_load_raises(routine):
+    with pytest.raises(RuntimeError):
+        asyncio.run(routine.wait_routine_result(1.0))
@@ -0,0 +1,37 @@
+import pickle
+
+from gpframe.contracts.exceptions import CollectedError
+
+class RecordingError(Exception):
+    def __init__(self):
+        self.formatted = False
+    def __repr__(self):
+        self.formatted = True
+        return "RecordingError()"
+
+def test_initial_creation_keeps_errors():
+    errors = {"a": ValueError("x")}
+    err = CollectedError(errors)
+    assert err.errors is errors
+
+def test_message_is_formatted_only_when_stringified():
+    cause = RecordingError()
+    err = CollectedError({"a": cause})
+    assert not cause.formatted
+    assert str(err) == "1 unchecked error(s) in frames:\n  a: RecordingError()"
+    assert cause.formatted
+
+def test_str_lists_every_frame():
+    err = CollectedError({"a": ValueError("x"), "b": KeyError("y")})
+    assert str(err) == "\n".join([
+        "2 unchecked error(s) in frames:",
+        "  a: ValueError('x')",
+        "  b: KeyError('y')",
+    ])
+
+def test_pickle_round_trip():
+    err = pickle.loads(pickle.dumps(CollectedError({"a": ValueError("x")})))
+    assert isinstance(err, CollectedError)
+    assert list(err.errors) == ["a"]
+    assert isinstance(err.errors["a"], ValueError)
+    assert str(err) == "1 unchecked error(s) in frames:\n  a: ValueError('x')"
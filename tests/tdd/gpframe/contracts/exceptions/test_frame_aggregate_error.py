@@ -0,0 +1,46 @@
+import pickle
+
+from gpframe.contracts.exceptions import FrameAggregateError, FrameStateError
+
+class RecordingError(Exception):
+    def __init__(self):
+        self.formatted = False
+    def __repr__(self):
+        self.formatted = True
+        return "RecordingError()"
+
+def test_initial_creation_keeps_errors():
+    circuit = ValueError("boom")
+    failed = {"sub": KeyError("k")}
+    err = FrameAggregateError("root", circuit, failed)
+    assert isinstance(err, FrameStateError)
+    assert err.frame_name == "root"
+    assert err.circuit_error is circuit
+    assert err.failed_frames is failed
+
+def test_circuit_error_is_chained():
+    circuit = ValueError("boom")
+    assert FrameAggregateError("root", circuit, {}).__cause__ is circuit
+    assert FrameAggregateError("root", None, {"sub": circuit}).__cause__ is None
+
+def test_message_is_formatted_only_when_stringified():
+    cause = RecordingError()
+    err = FrameAggregateError("root", None, {"sub": cause})
+    assert not cause.formatted
+    assert str(err) == "frame 'root' ended with errors:\n  sub: RecordingError()"
+    assert cause.formatted
+
+def test_str_lists_circuit_error_first():
+    err = FrameAggregateError("root", ValueError("x"), {"a": KeyError("y")})
+    assert str(err) == "\n".join([
+        "frame 'root' ended with errors:",
+        "  root: ValueError('x')",
+        "  a: KeyError('y')",
+    ])
+
+def test_pickle_round_trip():
+    err = pickle.loads(pickle.dumps(FrameAggregateError("root", ValueError("x"), {"a": KeyError("y")})))
+    assert isinstance(err, FrameAggregateError)
+    assert err.frame_name == "root"
+    assert isinstance(err.__cause__, ValueError)
+    assert list(err.failed_frames) == ["a"]
@@ -0,0 +1,7 @@
+from gpframe.contracts.exceptions import FrameStateError, GpFrameBaseError, MissingNameError
+
+def test_missing_name_error_is_a_frame_state_error():
+    err = MissingNameError("no valid frame name")
+    assert isinstance(err, FrameStateError)
+    assert isinstance(err, GpFrameBaseError)
+    assert not isinstance(err, ValueError)
@@ -0,0 +1,19 @@
+from gpframe.contracts.exceptions import GpFrameBaseError, RoutineSubprocessTimeoutError
+
+class FakeProcess:
+    pid = 42
+
+def test_initial_creation_keeps_process_and_timeout():
+    process = FakeProcess()
+    err = RoutineSubprocessTimeoutError(process, 2.0)
+    assert err.process is process
+    assert err.timeout == 2.0
+
+def test_is_a_timeout_error():
+    err = RoutineSubprocessTimeoutError(FakeProcess(), 2.0)
+    assert isinstance(err, TimeoutError)
+    assert isinstance(err, GpFrameBaseError)
+
+def test_str_names_pid_and_timeout():
+    err = RoutineSubprocessTimeoutError(FakeProcess(), 2.0)
+    assert str(err) == "routine subprocess (pid 42) did not finish within 2.0 seconds"
@@ -0,0 +1,23 @@
+import pickle
+
+from gpframe.contracts.exceptions import GpFrameBaseError, RoutineTaskTimeoutError
+
+def test_initial_creation_keeps_task_and_timeout():
+    task = object()
+    err = RoutineTaskTimeoutError(task, 1.5)
+    assert err.task is task
+    assert err.timeout == 1.5
+
+def test_is_a_timeout_error():
+    err = RoutineTaskTimeoutError(None, 1.5)
+    assert isinstance(err, TimeoutError)
+    assert isinstance(err, GpFrameBaseError)
+
+def test_str_names_timeout():
+    assert str(RoutineTaskTimeoutError(None, 1.5)) == "routine did not finish within 1.5 seconds"
+
+def test_pickle_round_trip():
+    err = pickle.loads(pickle.dumps(RoutineTaskTimeoutError("task", 1.5)))
+    assert isinstance(err, RoutineTaskTimeoutError)
+    assert err.task == "task"
+    assert err.timeout == 1.5
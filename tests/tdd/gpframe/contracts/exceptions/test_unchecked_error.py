@@ -1,7 +1,39 @@
+import pickle
 
 from gpframe.contracts.exceptions import UncheckedError
 
+class RecordingError(Exception):
+    def __init__(self):
+        self.formatted = False
+    def __repr__(self):
+        self.formatted = True
+        return "RecordingError()"
+
 def test_initial_creation_requires_frame_name_and_error():
     err = UncheckedError("worker", ValueError("boom"))
     assert err.frame_name == "worker"
-    assert isinstance(err.cause, ValueError)
\ No newline at end of file
+    assert isinstance(err.cause, ValueError)
+
+def test_cause_is_chained():
+    cause = ValueError("boom")
+    err = UncheckedError("worker", cause)
+    assert err.__cause__ is cause
+
+def test_message_is_formatted_only_when_stringified():
+    cause = RecordingError()
+    err = UncheckedError("worker", cause)
+    assert not cause.formatted
+    assert str(err) == "unchecked error in frame 'worker': RecordingError()"
+    assert cause.formatted
+
+def test_str_names_frame_and_cause():
+    err = UncheckedError("worker", ValueError("boom"))
+    assert str(err) == "unchecked error in frame 'worker': ValueError('boom')"
+
+def test_pickle_round_trip():
+    err = pickle.loads(pickle.dumps(UncheckedError("worker", ValueError("boom"))))
+    assert isinstance(err, UncheckedError)
+    assert err.frame_name == "worker"
+    assert isinstance(err.cause, ValueError)
+    assert err.__cause__ is err.cause
+    assert str(err) == "unchecked error in frame 'worker': ValueError('boom')"